@@ -9,6 +9,7 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_
+from sqlalchemy.exc import IntegrityError
 from loguru import logger
 
 from database import get_db
@@ -20,6 +21,23 @@ from core.security import get_current_user
 router = APIRouter()
 
 
+async def _commit_job(db: AsyncSession):
+    """
+    Commit a created or updated job.
+    
+    Raises:
+        HTTPException: 409 if the job duplicates a stored one (ix_jobs_dedupe)
+    """
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A job with this title, company and apply URL already exists"
+        )
+
+
 @router.get("/", response_model=JobListResponse)
 async def list_jobs(
     page: int = Query(1, ge=1),
@@ -138,11 +156,14 @@ async def create_job(
         
     Returns:
         Created job
+        
+    Raises:
+        HTTPException: If the same job is already listed
     """
     job = Job(**job_data.model_dump())
     
     db.add(job)
-    await db.commit()
+    await _commit_job(db)
     await db.refresh(job)
     
     logger.info(f"Job created: {job.id} - {job.title}")
@@ -166,6 +187,9 @@ async def update_job(
         
     Returns:
         Updated job
+        
+    Raises:
+        HTTPException: If the job is missing or the update duplicates another job
     """
     result = await db.execute(select(Job).where(Job.id == job_id))
     job = result.scalar_one_or_none()
@@ -180,7 +204,7 @@ async def update_job(
     for field, value in job_data.model_dump(exclude_unset=True).items():
         setattr(job, field, value)
     
-    await db.commit()
+    await _commit_job(db)
     await db.refresh(job)
     
     logger.info(f"Job updated: {job_id}")
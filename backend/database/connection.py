@@ -5,6 +5,8 @@ Database Connection
 SQLAlchemy async database connection and session management.
 """
 
+import asyncio
+
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from typing import AsyncGenerator
@@ -12,11 +14,30 @@ from typing import AsyncGenerator
 from core.config import settings
 
 
+def _pool_options(database_url: str) -> dict:
+    """
+    Connection pool settings for the engine.
+    
+    Server databases (PostgreSQL in production) get a sized pool that checks
+    and recycles connections the server may have dropped while idle. SQLite
+    keeps SQLAlchemy's defaults; opening a file is cheap and never goes stale.
+    """
+    if database_url.startswith("sqlite"):
+        return {}
+    return {
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800
+    }
+
+
 # Create async engine
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
-    future=True
+    future=True,
+    **_pool_options(settings.DATABASE_URL)
 )
 
 # Create async session factory
@@ -52,3 +73,17 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+async def warmup_pool(n: int = 5):
+    """
+    Open n connections at once and return them to the pool.
+    
+    Run at startup so the first requests reuse established connections
+    instead of each paying the connect cost.
+    
+    Args:
+        n: Number of connections to open; at most pool_size are kept
+    """
+    connections = await asyncio.gather(*(engine.connect().start() for _ in range(n)))
+    await asyncio.gather(*(conn.close() for conn in connections))
@@ -0,0 +1,127 @@
+"""
+Seed Job Loading
+================
+
+Streams data/raw/seed_jobs.json into the jobs table in batches.
+Shared by reset_database.py, fix_schema.py and scripts/seed_database.py.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+
+from sqlalchemy import insert
+
+from models import Job
+
+# Stream the seed file when ijson is available
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# Rows sent per executemany while streaming seed jobs
+SEED_INSERT_BATCH = 500
+
+
+def iter_seed_jobs(seed_file: Path):
+    """Yield seed jobs one at a time, without loading the whole file if possible."""
+    if IJSON_AVAILABLE:
+        with open(seed_file, "rb") as f:
+            yield from ijson.items(f, "item", use_float=True)
+    else:
+        with open(seed_file, "r") as f:
+            yield from json.load(f)
+
+
+def job_row(job_data: dict, default_description: str = "") -> dict:
+    """Map a seed job to a jobs table row."""
+    return {
+        "title": job_data["title"],
+        "company": job_data["company"],
+        "description": job_data.get("description", default_description),
+        "requirements": job_data.get("requirements"),
+        "skills_required": job_data.get("skills_required", []),
+        "experience_required": job_data.get("experience_required"),
+        "education_required": job_data.get("education_required"),
+        "location": job_data.get("location"),
+        "job_type": job_data.get("job_type"),
+        "remote_option": job_data.get("remote_option"),
+        "salary_min": job_data.get("salary_min"),
+        "salary_max": job_data.get("salary_max"),
+        "salary_currency": "USD",
+        "apply_url": job_data.get("apply_url"),
+        "is_active": 1
+    }
+
+
+def take_rows(jobs, n: int, default_description: str = "") -> list:
+    """Map up to n jobs from the iterator to table rows."""
+    return [job_row(job_data, default_description) for job_data in islice(jobs, n)]
+
+
+async def insert_seed_jobs(conn, seed_file: Path, default_description: str = "") -> int:
+    """
+    Insert seed jobs in batches of SEED_INSERT_BATCH rows.
+    
+    SQLite has a single writer, so batches are inserted one after another
+    on the same connection; parsing and mapping the next batch runs in a
+    worker thread while the current one is written.
+    
+    Args:
+        conn: Open connection; the caller owns the transaction
+        seed_file: Path to the seed jobs JSON array
+        default_description: Description stored for jobs without one
+    
+    Returns:
+        Number of rows inserted
+    """
+    if conn.dialect.driver == "asyncpg":
+        return await copy_seed_jobs(conn, seed_file, default_description)
+    
+    loop = asyncio.get_running_loop()
+    jobs = iter_seed_jobs(seed_file)
+    inserted = 0
+    batch = take_rows(jobs, SEED_INSERT_BATCH, default_description)
+    while batch:
+        _, next_batch = await asyncio.gather(
+            conn.execute(insert(Job), batch),
+            loop.run_in_executor(None, take_rows, jobs, SEED_INSERT_BATCH, default_description)
+        )
+        inserted += len(batch)
+        batch = next_batch
+    return inserted
+
+
+async def copy_seed_jobs(conn, seed_file: Path, default_description: str = "") -> int:
+    """
+    Load seed jobs with PostgreSQL COPY on the underlying asyncpg connection.
+    
+    COPY streams each batch without parsing an INSERT statement. It bypasses
+    SQLAlchemy, so the JSON column is encoded and the timestamp defaults are
+    filled in here.
+    
+    Returns:
+        Number of rows inserted
+    """
+    raw = await conn.get_raw_connection()
+    copy_conn = raw.driver_connection
+    now = datetime.utcnow()
+    jobs = iter_seed_jobs(seed_file)
+    inserted = 0
+    batch = take_rows(jobs, SEED_INSERT_BATCH, default_description)
+    while batch:
+        columns = list(batch[0]) + ["created_at", "updated_at"]
+        records = []
+        for row in batch:
+            row["skills_required"] = json.dumps(row["skills_required"])
+            records.append((*row.values(), now, now))
+        await copy_conn.copy_records_to_table(
+            Job.__tablename__, records=records, columns=columns
+        )
+        inserted += len(batch)
+        batch = take_rows(jobs, SEED_INSERT_BATCH, default_description)
+    return inserted
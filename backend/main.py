@@ -18,7 +18,7 @@ from loguru import logger
 import sys
 
 from core.config import settings
-from database.connection import engine, Base
+from database.connection import engine, Base, warmup_pool
 from api import auth, resumes, jobs, matches, recommendations
 
 
@@ -53,6 +53,9 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     logger.info("✅ Database tables created/verified")
     
+    # Fill the connection pool before the first request needs it
+    await warmup_pool()
+    
     # TODO: Load ML models
     logger.info("✅ ML models loaded")
     
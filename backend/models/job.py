@@ -6,7 +6,7 @@ SQLAlchemy model for job listings.
 """
 
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, LargeBinary, Float
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, LargeBinary, Float, Index
 
 from database.connection import Base
 
@@ -35,6 +35,10 @@ class Job(Base):
     """
     
     __tablename__ = "jobs"
+    __table_args__ = (
+        # One row per listing; scraped jobs are inserted with ON CONFLICT DO NOTHING
+        Index("ix_jobs_dedupe", "title", "company", "apply_url", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -15,17 +15,33 @@ import asyncio
 import json
 import re
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, Union
 from loguru import logger
 
 import requests
 import feedparser
 from bs4 import BeautifulSoup
 
+from services.skill_extractor import SkillTrie
+
 
 class JobScraperService:
     """Scrapes jobs from multiple free sources."""
     
+    # Skills recognised in scraped job descriptions
+    SKILL_KEYWORDS = (
+        'python', 'javascript', 'typescript', 'react', 'node.js', 'nodejs',
+        'java', 'c++', 'c#', 'go', 'golang', 'rust', 'ruby', 'php',
+        'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
+        'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform',
+        'machine learning', 'deep learning', 'ai', 'nlp', 'pytorch', 'tensorflow',
+        'react native', 'flutter', 'swift', 'kotlin', 'android', 'ios',
+        'git', 'agile', 'scrum', 'devops', 'ci/cd', 'jenkins',
+        'fastapi', 'django', 'flask', 'express', 'spring', 'rails'
+    )
+    
+    _SKILL_TRIE = SkillTrie(SKILL_KEYWORDS)
+    
     def __init__(self):
         self.headers = {
             'User-Agent': 'TalentLens AI Job Aggregator (Educational Project)',
@@ -380,24 +396,9 @@ class JobScraperService:
         
         return jobs[:15]
     
-    def extract_skills_from_text(self, text: str) -> List[str]:
-        """Extract skills from job description."""
-        skills_keywords = [
-            'python', 'javascript', 'typescript', 'react', 'node.js', 'nodejs',
-            'java', 'c++', 'c#', 'go', 'golang', 'rust', 'ruby', 'php',
-            'sql', 'postgresql', 'mysql', 'mongodb', 'redis', 'elasticsearch',
-            'aws', 'azure', 'gcp', 'docker', 'kubernetes', 'terraform',
-            'machine learning', 'deep learning', 'ai', 'nlp', 'pytorch', 'tensorflow',
-            'react native', 'flutter', 'swift', 'kotlin', 'android', 'ios',
-            'git', 'agile', 'scrum', 'devops', 'ci/cd', 'jenkins',
-            'fastapi', 'django', 'flask', 'express', 'spring', 'rails'
-        ]
-        
-        text_lower = text.lower()
-        found_skills = []
-        
-        for skill in skills_keywords:
-            if skill in text_lower:
-                found_skills.append(skill)
+    def extract_skills_from_text(self, text: Union[str, List[str]]) -> List[str]:
+        """Extract skills from job description (or its SkillTrie tokens)."""
+        found = self._SKILL_TRIE.find(text)
+        found_skills = [skill for skill in self.SKILL_KEYWORDS if skill in found]
         
         return found_skills[:10]  # Return top 10 skills
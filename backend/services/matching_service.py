@@ -34,7 +34,8 @@ class MatchingService:
     async def calculate_match(
         self, 
         resume, 
-        job
+        job,
+        semantic_score: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Calculate comprehensive match score between resume and job.
@@ -42,13 +43,16 @@ class MatchingService:
         Args:
             resume: Resume model instance
             job: Job model instance
+            semantic_score: Precomputed semantic score (0-100), e.g. from
+                calculate_semantic_scores; skips embedding the pair
             
         Returns:
             Dictionary with scores and analysis
         """
         # Calculate individual scores
         skill_result = await self._calculate_skill_score(resume, job)
-        semantic_score = await self._calculate_semantic_score(resume, job)
+        if semantic_score is None:
+            semantic_score = await self._calculate_semantic_score(resume, job)
         experience_score = self._calculate_experience_score(resume, job)
         education_score = self._calculate_education_score(resume, job)
         
@@ -139,6 +143,46 @@ class MatchingService:
             logger.error(f"Semantic score calculation failed: {e}")
             return 50.0
     
+    async def calculate_semantic_scores(self, resume, jobs: List) -> List[float]:
+        """
+        Semantic scores of one resume against many jobs.
+        
+        Same scores as _calculate_semantic_score per job, but the resume is
+        embedded once and the jobs in one batch, and the cosines come from
+        a single matrix-vector product.
+        
+        Args:
+            resume: Resume model instance
+            jobs: Job model instances
+            
+        Returns:
+            Semantic score (0-100) per job, in input order
+        """
+        resume_text = resume.raw_text or ""
+        if not resume_text or not jobs:
+            return [50.0] * len(jobs)  # Neutral score if text unavailable
+        
+        try:
+            resume_embedding = await self.embedding_service.embed_text(resume_text)
+            job_embeddings = await self.embedding_service.embed_texts([
+                f"{job.title} {job.description} {job.requirements or ''}"
+                for job in jobs
+            ])
+            
+            # Cosine similarity, 0 where either vector is zero
+            norms = np.linalg.norm(job_embeddings, axis=1) * np.linalg.norm(resume_embedding)
+            dots = job_embeddings @ resume_embedding
+            similarity = np.divide(dots, norms, out=np.zeros_like(norms), where=norms != 0)
+            
+            # Scale to [0, 1] like compute_similarity, except zero vectors
+            scores = np.clip((similarity + 1) / 2, 0.0, 1.0)
+            scores[norms == 0] = 0.0
+            return (scores * 100).tolist()
+            
+        except Exception as e:
+            logger.error(f"Semantic score calculation failed: {e}")
+            return [50.0] * len(jobs)
+    
     def _calculate_experience_score(self, resume, job) -> float:
         """Calculate experience match score."""
         resume_exp = resume.experience_years or 0
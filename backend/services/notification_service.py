@@ -10,9 +10,13 @@ Sends notifications via:
 
 import smtplib
 import os
+import time
+import hashlib
+from collections import OrderedDict
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Optional
+from string import Template
+from typing import List, Dict, Optional, Tuple
 from loguru import logger
 
 try:
@@ -23,18 +27,83 @@ except ImportError:
     logger.warning("Desktop notifications not available (plyer not installed)")
 
 
+# Email configuration (set in environment variables), read once at import
+_SMTP_SERVER = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
+_SMTP_PORT = int(os.getenv('SMTP_PORT', '587'))
+_EMAIL_USER = os.getenv('EMAIL_USER', '')
+_EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD', '')  # App password for Gmail
+_NOTIFICATION_EMAIL = os.getenv('NOTIFICATION_EMAIL', '')  # Where to send alerts
+
+# Suppress repeat alerts for the same job within this window
+_ALERT_DEDUP_WINDOW_SECONDS = 24 * 60 * 60
+_ALERT_DEDUP_MAX_ENTRIES = 10_000
+
+# HTML templates, parsed once at import and filled per notification
+_EMAIL_TEMPLATE = Template("""
+            <html>
+            <body style="font-family: Arial, sans-serif; padding: 20px;">
+                <h2 style="color: #6366f1;">🎯 TalentLens AI - New Job Alert!</h2>
+                <div style="background: #f0f9ff; padding: 15px; border-radius: 8px;">
+                    $body
+                </div>
+                <hr style="margin: 20px 0;">
+                <p style="color: #666; font-size: 12px;">
+                    This is an automated notification from TalentLens AI Job Monitor.
+                </p>
+            </body>
+            </html>
+            """)
+
+_JOB_ROW_TEMPLATE = Template("""
+                <div style="background: white; padding: 15px; margin: 10px 0; border-radius: 8px; border-left: 4px solid $score_color;">
+                    <h3 style="margin: 0; color: #1e293b;">$title</h3>
+                    <p style="margin: 5px 0; color: #64748b;">
+                        <strong>$company</strong> • $location
+                    </p>
+                    <p style="margin: 5px 0; color: #6366f1; font-weight: bold;">
+                        Match Score: $match_score%
+                    </p>
+                    <p style="margin: 10px 0; color: #475569; font-size: 14px;">
+                        $description...
+                    </p>
+                    <a href="$apply_url" 
+                       style="display: inline-block; background: #6366f1; color: white; 
+                              padding: 8px 16px; text-decoration: none; border-radius: 5px;">
+                        Apply Now →
+                    </a>
+                    <span style="color: #94a3b8; font-size: 12px; margin-left: 10px;">
+                        Source: $source
+                    </span>
+                </div>
+                """)
+
+_JOB_ALERT_TEMPLATE = Template("""
+            <p style="color: #1e293b; font-size: 16px;">
+                Found <strong>$job_count</strong> new job$plural matching your profile:
+            </p>
+            $job_rows
+            <p style="color: #64748b; margin-top: 20px;">
+                <a href="http://localhost:5173/recommendations" style="color: #6366f1;">
+                    View all recommendations in TalentLens AI →
+                </a>
+            </p>
+            """)
+
+
 class NotificationService:
     """
     Sends notifications through multiple channels.
     """
     
+    # Recently alerted job hashes -> monotonic time of the alert, shared across instances
+    _recent_alerts: "OrderedDict[bytes, float]" = OrderedDict()
+    
     def __init__(self):
-        # Email configuration (set in environment variables)
-        self.smtp_server = os.getenv('SMTP_SERVER', 'smtp.gmail.com')
-        self.smtp_port = int(os.getenv('SMTP_PORT', '587'))
-        self.email_user = os.getenv('EMAIL_USER', '')
-        self.email_password = os.getenv('EMAIL_PASSWORD', '')  # App password for Gmail
-        self.notification_email = os.getenv('NOTIFICATION_EMAIL', '')  # Where to send alerts
+        self.smtp_server = _SMTP_SERVER
+        self.smtp_port = _SMTP_PORT
+        self.email_user = _EMAIL_USER
+        self.email_password = _EMAIL_PASSWORD
+        self.notification_email = _NOTIFICATION_EMAIL
     
     def send_desktop_notification(self, title: str, message: str, timeout: int = 10) -> bool:
         """
@@ -93,20 +162,7 @@ class NotificationService:
             msg['To'] = recipient
             
             # Create HTML body
-            html_body = f"""
-            <html>
-            <body style="font-family: Arial, sans-serif; padding: 20px;">
-                <h2 style="color: #6366f1;">🎯 TalentLens AI - New Job Alert!</h2>
-                <div style="background: #f0f9ff; padding: 15px; border-radius: 8px;">
-                    {body}
-                </div>
-                <hr style="margin: 20px 0;">
-                <p style="color: #666; font-size: 12px;">
-                    This is an automated notification from TalentLens AI Job Monitor.
-                </p>
-            </body>
-            </html>
-            """
+            html_body = _EMAIL_TEMPLATE.substitute(body=body)
             
             msg.attach(MIMEText(html_body, 'html'))
             
@@ -135,10 +191,14 @@ class NotificationService:
         Returns:
             Status dict with results
         """
+        total_jobs = len(jobs)
+        jobs, alert_keys = self._filter_recent_alerts(jobs)
+        
         results = {
             'desktop_sent': False,
             'email_sent': False,
-            'jobs_count': len(jobs)
+            'jobs_count': len(jobs),
+            'duplicates_skipped': total_jobs - len(jobs)
         }
         
         if not jobs:
@@ -173,45 +233,91 @@ class NotificationService:
                 match_score = job.get('match_score', 0)
                 score_color = '#22c55e' if match_score >= 70 else '#f59e0b' if match_score >= 50 else '#64748b'
                 
-                job_rows.append(f"""
-                <div style="background: white; padding: 15px; margin: 10px 0; border-radius: 8px; border-left: 4px solid {score_color};">
-                    <h3 style="margin: 0; color: #1e293b;">{job.get('title', 'Unknown Title')}</h3>
-                    <p style="margin: 5px 0; color: #64748b;">
-                        <strong>{job.get('company', 'Unknown')}</strong> • {job.get('location', 'Remote')}
-                    </p>
-                    <p style="margin: 5px 0; color: #6366f1; font-weight: bold;">
-                        Match Score: {match_score}%
-                    </p>
-                    <p style="margin: 10px 0; color: #475569; font-size: 14px;">
-                        {job.get('description', '')[:200]}...
-                    </p>
-                    <a href="{job.get('apply_url', '#')}" 
-                       style="display: inline-block; background: #6366f1; color: white; 
-                              padding: 8px 16px; text-decoration: none; border-radius: 5px;">
-                        Apply Now →
-                    </a>
-                    <span style="color: #94a3b8; font-size: 12px; margin-left: 10px;">
-                        Source: {job.get('source', 'Unknown')}
-                    </span>
-                </div>
-                """)
+                job_rows.append(_JOB_ROW_TEMPLATE.substitute(
+                    score_color=score_color,
+                    title=job.get('title', 'Unknown Title'),
+                    company=job.get('company', 'Unknown'),
+                    location=job.get('location', 'Remote'),
+                    match_score=match_score,
+                    description=job.get('description', '')[:200],
+                    apply_url=job.get('apply_url', '#'),
+                    source=job.get('source', 'Unknown')
+                ))
             
-            body = f"""
-            <p style="color: #1e293b; font-size: 16px;">
-                Found <strong>{job_count}</strong> new job{'s' if job_count > 1 else ''} matching your profile:
-            </p>
-            {''.join(job_rows)}
-            <p style="color: #64748b; margin-top: 20px;">
-                <a href="http://localhost:5173/recommendations" style="color: #6366f1;">
-                    View all recommendations in TalentLens AI →
-                </a>
-            </p>
-            """
+            body = _JOB_ALERT_TEMPLATE.substitute(
+                job_count=job_count,
+                plural='s' if job_count > 1 else '',
+                job_rows=''.join(job_rows)
+            )
             
             results['email_sent'] = self.send_email_notification(subject, body)
         
+        # Only suppress repeats of alerts that actually reached the user
+        if results['desktop_sent'] or results['email_sent']:
+            self._record_alerts(alert_keys)
+        
         return results
     
+    @staticmethod
+    def _alert_key(job: Dict) -> bytes:
+        """Identity of a job for alert dedup."""
+        return hashlib.blake2b(
+            "|".join(
+                str(job.get(field) or '').strip().lower()
+                for field in ('source', 'apply_url', 'title', 'company')
+            ).encode(),
+            digest_size=16
+        ).digest()
+    
+    def _filter_recent_alerts(self, jobs: List[Dict]) -> Tuple[List[Dict], List[bytes]]:
+        """
+        Drop jobs already alerted within the dedup window or repeated in jobs.
+        
+        Nothing is recorded here; call _record_alerts once a channel has
+        delivered the alert.
+        
+        Args:
+            jobs: Candidate jobs for an alert
+            
+        Returns:
+            Jobs that have not been alerted recently, and their alert keys
+        """
+        now = time.monotonic()
+        recent = NotificationService._recent_alerts
+        fresh_jobs = []
+        fresh_keys = []
+        seen = set()
+        
+        for job in jobs:
+            key = self._alert_key(job)
+            if key in seen:
+                continue
+            
+            alerted_at = recent.get(key)
+            if alerted_at is not None and now - alerted_at < _ALERT_DEDUP_WINDOW_SECONDS:
+                continue
+            
+            seen.add(key)
+            fresh_jobs.append(job)
+            fresh_keys.append(key)
+        
+        if len(fresh_jobs) < len(jobs):
+            logger.info(f"Skipped {len(jobs) - len(fresh_jobs)} jobs already alerted in the last 24h")
+        
+        return fresh_jobs, fresh_keys
+    
+    def _record_alerts(self, keys: List[bytes]):
+        """Start the dedup window for jobs whose alert was delivered."""
+        now = time.monotonic()
+        recent = NotificationService._recent_alerts
+        
+        for key in keys:
+            recent[key] = now
+            recent.move_to_end(key)
+        
+        while len(recent) > _ALERT_DEDUP_MAX_ENTRIES:
+            recent.popitem(last=False)
+    
     def test_notifications(self) -> Dict:
         """Test all notification channels."""
         results = {}
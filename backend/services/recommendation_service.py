@@ -5,7 +5,7 @@ Recommendation Service
 Service for generating personalized job recommendations using hybrid approach.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import numpy as np
 from loguru import logger
 
@@ -91,9 +91,16 @@ class RecommendationService:
         scored_jobs = []
         logger.info(f"Scoring {len(filtered_jobs)} jobs for resume {resume.id}")
         
-        for job in filtered_jobs:
+        # Embed the resume once and all job texts in one batch
+        semantic_scores = await self.matching_service.calculate_semantic_scores(
+            resume, filtered_jobs
+        )
+        
+        for job, semantic_score in zip(filtered_jobs, semantic_scores):
             try:
-                match_result = await self.matching_service.calculate_match(resume, job)
+                match_result = await self.matching_service.calculate_match(
+                    resume, job, semantic_score=semantic_score
+                )
                 
                 # Bonus for Islamabad or Remote based on user preference
                 score = match_result["overall_score"]
@@ -278,34 +285,34 @@ class RecommendationService:
         """
         resume_skills = set(s.lower() for s in (resume.skills or []))
         
-        # Aggregate required skills from all jobs
-        all_required_skills = {}
+        # Bit position of each lowercased skill seen in this analysis
+        skill_bits: Dict[str, int] = {}
+        resume_mask, _ = self._skill_mask(resume_skills, skill_bits)
+        
+        # Aggregate required skills from all jobs as bitmasks
+        all_required_mask = 0
+        job_bits = []
         
         for job in jobs:
-            job_skills = job.skills_required or []
-            for skill in job_skills:
-                skill_lower = skill.lower()
-                if skill_lower not in all_required_skills:
-                    all_required_skills[skill_lower] = 0
-                all_required_skills[skill_lower] += 1
+            job_mask, bits = self._skill_mask(job.skills_required or [], skill_bits)
+            all_required_mask |= job_mask
+            job_bits.extend(bits)
         
-        # Find missing skills sorted by frequency
-        missing_skills = {
-            skill: count 
-            for skill, count in all_required_skills.items() 
-            if skill not in resume_skills
-        }
+        # Per-skill frequency across jobs
+        skill_names = list(skill_bits)
+        counts = np.bincount(job_bits, minlength=len(skill_names))
         
-        sorted_gaps = sorted(
-            missing_skills.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )
+        # Find missing skills sorted by frequency
+        missing_bits = np.array(self._mask_bits(all_required_mask & ~resume_mask), dtype=np.intp)
+        missing_bits = missing_bits[np.argsort(-counts[missing_bits], kind="stable")]
+        gap_counts = counts[missing_bits]
+        gap_names = np.array([skill_names[bit] for bit in missing_bits], dtype=object)
         
-        # Categorize gaps
-        critical_gaps = [s for s, c in sorted_gaps if c >= len(jobs) * 0.7]
-        important_gaps = [s for s, c in sorted_gaps if len(jobs) * 0.3 <= c < len(jobs) * 0.7]
-        nice_to_have = [s for s, c in sorted_gaps if c < len(jobs) * 0.3]
+        # Categorize gaps: 0 = nice to have, 1 = important, 2 = critical
+        tiers = np.digitize(gap_counts, [len(jobs) * 0.3, len(jobs) * 0.7])
+        critical_gaps = gap_names[tiers == 2].tolist()
+        important_gaps = gap_names[tiers == 1].tolist()
+        nice_to_have = gap_names[tiers == 0].tolist()
         
         return {
             "total_jobs_analyzed": len(jobs),
@@ -313,10 +320,48 @@ class RecommendationService:
             "critical_gaps": critical_gaps[:5],
             "important_gaps": important_gaps[:5],
             "nice_to_have": nice_to_have[:5],
-            "overall_coverage": len(resume_skills.intersection(all_required_skills)) / len(all_required_skills) * 100 if all_required_skills else 100,
+            "overall_coverage": (resume_mask & all_required_mask).bit_count() / all_required_mask.bit_count() * 100 if all_required_mask else 100,
             "recommendation": self._generate_gap_recommendation(critical_gaps, important_gaps)
         }
     
+    @staticmethod
+    def _skill_mask(skills, skill_bits: Dict[str, int]) -> Tuple[int, List[int]]:
+        """
+        Encode skills as a bitmask, assigning new bits to unseen skills.
+        
+        Args:
+            skills: Skill names to encode
+            skill_bits: Bit position of each lowercased skill, extended in place
+            
+        Returns:
+            Tuple of (bitmask, distinct bit positions set in it)
+        """
+        mask = 0
+        bits = []
+        
+        for skill in skills:
+            skill_lower = skill.lower()
+            bit = skill_bits.get(skill_lower)
+            if bit is None:
+                bit = len(skill_bits)
+                skill_bits[skill_lower] = bit
+            
+            if not mask >> bit & 1:
+                mask |= 1 << bit
+                bits.append(bit)
+        
+        return mask, bits
+    
+    @staticmethod
+    def _mask_bits(mask: int) -> List[int]:
+        """List the bit positions set in a mask, lowest first."""
+        bits = []
+        while mask:
+            low = mask & -mask
+            bits.append(low.bit_length() - 1)
+            mask ^= low
+        return bits
+    
     def _generate_gap_recommendation(
         self, 
         critical: List[str], 
@@ -7,6 +7,7 @@ Service for extracting text and structure from PDF and DOCX files.
 
 import io
 import re
+import zipfile
 from typing import Dict, Any, List, Optional
 from loguru import logger
 
@@ -22,6 +23,46 @@ try:
 except ImportError:
     Document = None
 
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# WordprocessingML tags streamed out of word/document.xml
+_W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_W_TEXT = _W_NS + "t"
+_W_PARAGRAPH = _W_NS + "p"
+
+# Run content that python-docx renders as whitespace between runs
+_W_BREAKS = {_W_NS + "tab": "\t", _W_NS + "br": "\n", _W_NS + "cr": "\n"}
+
+# Legacy copy of mc:AlternateContent (e.g. VML text boxes), skipped to avoid duplicates
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+
+# Punctuation kept by _clean_text in addition to word characters and whitespace
+_KEEP_PUNCTUATION = frozenset(".,;:!?@#$%&*()-+=[]{}'\"/")
+
+
+class _CleanTable(dict):
+    """
+    str.translate table that deletes every character _clean_text drops.
+
+    Entries are filled lazily per code point, so the table only ever holds
+    characters that have actually been seen.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        char = chr(codepoint)
+        keep = char.isalnum() or char == "_" or char.isspace() or char in _KEEP_PUNCTUATION
+        value = codepoint if keep else None
+        self[codepoint] = value
+        return value
+
+
+_CLEAN_TABLE = _CleanTable()
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
 class ResumeParserService:
     """
@@ -38,6 +79,37 @@ class ResumeParserService:
         "certifications": r"(?i)(certifications|certificates|licenses)",
     }
     
+    # Upper-case spellings of the same headers, tried case-sensitively first
+    CAPS_SECTION_HEADERS = {
+        "experience": ("WORK EXPERIENCE", "PROFESSIONAL EXPERIENCE", "EMPLOYMENT HISTORY", "EXPERIENCE"),
+        "education": ("EDUCATION", "ACADEMIC BACKGROUND", "QUALIFICATIONS"),
+        "skills": ("SKILLS", "TECHNICAL SKILLS", "COMPETENCIES", "EXPERTISE"),
+        "summary": ("SUMMARY", "PROFILE", "OBJECTIVE", "ABOUT ME"),
+        "projects": ("PROJECTS", "PERSONAL PROJECTS", "PORTFOLIO"),
+        "certifications": ("CERTIFICATIONS", "CERTIFICATES", "LICENSES"),
+    }
+    
+    _SECTION_RES = {name: re.compile(pattern) for name, pattern in SECTION_PATTERNS.items()}
+    
+    # Common degree patterns
+    _DEGREE_RES = [
+        re.compile(r"(?i)(bachelor|b\.?s\.?|b\.?a\.?|b\.?sc\.?)"),
+        re.compile(r"(?i)(master|m\.?s\.?|m\.?a\.?|m\.?sc\.?|mba)"),
+        re.compile(r"(?i)(ph\.?d\.?|doctorate|doctor)"),
+        re.compile(r"(?i)(associate|a\.?s\.?|a\.?a\.?)"),
+        re.compile(r"(?i)(diploma|certificate)"),
+    ]
+    
+    _GRADUATION_YEAR_RE = re.compile(r"20\d{2}|19\d{2}")
+    
+    # Date range pattern for work experience
+    _WORK_DATES_RE = re.compile(
+        r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|\d{4})\s*[-–]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|\d{4}|Present|Current)",
+        re.IGNORECASE
+    )
+    
+    _YEAR_RE = re.compile(r'(\d{4})')
+    
     async def parse(self, file_content: bytes, file_ext: str) -> Dict[str, Any]:
         """
         Parse a resume file and extract structured information.
@@ -76,11 +148,12 @@ class ResumeParserService:
     async def _extract_pdf_text(self, content: bytes) -> str:
         """Extract text from PDF file."""
         text = ""
+        # One in-memory buffer shared by both extractors
+        pdf_file = io.BytesIO(content)
         
         # Try PyPDF2 first
         if PyPDF2:
             try:
-                pdf_file = io.BytesIO(content)
                 reader = PyPDF2.PdfReader(pdf_file)
                 for page in reader.pages:
                     text += page.extract_text() + "\n"
@@ -90,7 +163,7 @@ class ResumeParserService:
         # Fallback to pdfminer if text is empty or too short
         if len(text.strip()) < 100 and pdfminer_extract:
             try:
-                pdf_file = io.BytesIO(content)
+                pdf_file.seek(0)
                 text = pdfminer_extract(pdf_file)
             except Exception as e:
                 logger.warning(f"pdfminer extraction failed: {e}")
@@ -99,23 +172,14 @@ class ResumeParserService:
     
     async def _extract_docx_text(self, content: bytes) -> str:
         """Extract text from DOCX file."""
-        if not Document:
+        if etree is None and not Document:
             raise ImportError("python-docx is required for DOCX parsing")
         
         try:
-            doc_file = io.BytesIO(content)
-            doc = Document(doc_file)
-            
-            text = ""
-            for para in doc.paragraphs:
-                text += para.text + "\n"
-            
-            # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        text += cell.text + " "
-                    text += "\n"
+            if etree is not None:
+                text = self._stream_docx_text(content)
+            else:
+                text = self._read_docx_text(content)
             
             return self._clean_text(text)
             
@@ -123,28 +187,79 @@ class ResumeParserService:
             logger.error(f"DOCX extraction failed: {e}")
             raise
     
+    def _stream_docx_text(self, content: bytes) -> str:
+        """Stream <w:t> runs out of word/document.xml without building a DOM."""
+        parts = []
+        fallback_depth = 0
+        
+        with zipfile.ZipFile(io.BytesIO(content)) as archive:
+            with archive.open("word/document.xml") as document_xml:
+                for event, element in etree.iterparse(
+                    document_xml,
+                    events=("start", "end"),
+                    tag=(_W_TEXT, _W_PARAGRAPH, _MC_FALLBACK, *_W_BREAKS)
+                ):
+                    if element.tag == _MC_FALLBACK:
+                        fallback_depth += 1 if event == "start" else -1
+                        continue
+                    
+                    if event == "start" or fallback_depth:
+                        continue
+                    
+                    if element.tag == _W_TEXT:
+                        if element.text:
+                            parts.append(element.text)
+                    elif element.tag != _W_PARAGRAPH:
+                        parts.append(_W_BREAKS[element.tag])
+                    else:
+                        # Paragraph finished (body or table cell)
+                        parts.append("\n")
+                        element.clear()
+                        while element.getprevious() is not None:
+                            del element.getparent()[0]
+        
+        return "".join(parts)
+    
+    def _read_docx_text(self, content: bytes) -> str:
+        """Extract DOCX text via python-docx (used when lxml is unavailable)."""
+        doc = Document(io.BytesIO(content))
+        
+        text = ""
+        for para in doc.paragraphs:
+            text += para.text + "\n"
+        
+        # Also extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    text += cell.text + " "
+                text += "\n"
+        
+        return text
+    
     def _clean_text(self, text: str) -> str:
         """Clean extracted text."""
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Remove special characters but keep punctuation
-        text = re.sub(r'[^\w\s.,;:!?@#$%&*()\-+=\[\]{}\'\"\/]', '', text)
+        # Remove special characters but keep punctuation, then collapse whitespace
+        text = _WHITESPACE_RE.sub(' ', text.translate(_CLEAN_TABLE))
         return text.strip()
     
     def _parse_sections(self, text: str) -> Dict[str, str]:
         """Parse resume into sections based on common headers."""
-        sections = {}
-        
-        # Find all section matches
-        all_matches = []
-        for section_name, pattern in self.SECTION_PATTERNS.items():
-            for match in re.finditer(pattern, text):
-                all_matches.append((match.start(), match.end(), section_name))
+        # Fast path: most resumes write headers in ALL CAPS
+        all_matches = self._find_caps_headers(text)
         
-        # Sort by position
-        all_matches.sort(key=lambda x: x[0])
+        if len({section_name for _, _, section_name in all_matches}) < 2:
+            # Find all section matches
+            all_matches = []
+            for section_name, pattern in self._SECTION_RES.items():
+                for match in pattern.finditer(text):
+                    all_matches.append((match.start(), match.end(), section_name))
+            
+            # Sort by position
+            all_matches.sort(key=lambda x: x[0])
         
         # Extract section content
+        sections = {}
         for i, (start, end, section_name) in enumerate(all_matches):
             if i < len(all_matches) - 1:
                 next_start = all_matches[i + 1][0]
@@ -154,25 +269,39 @@ class ResumeParserService:
         
         return sections
     
+    def _find_caps_headers(self, text: str) -> List[tuple]:
+        """Locate ALL CAPS section headers with plain substring search."""
+        candidates = []
+        for section_name, headers in self.CAPS_SECTION_HEADERS.items():
+            for header in headers:
+                start = text.find(header)
+                while start != -1:
+                    end = start + len(header)
+                    # Skip headers embedded in longer upper-case words
+                    if (start == 0 or not text[start - 1].isalnum()) and \
+                            (end == len(text) or not text[end].isalnum()):
+                        candidates.append((start, end, section_name))
+                    start = text.find(header, end)
+        
+        # Prefer the longest header at each position and drop overlaps
+        # (e.g. "EXPERIENCE" inside "WORK EXPERIENCE")
+        candidates.sort(key=lambda x: (x[0], -x[1]))
+        matches = []
+        last_end = -1
+        for start, end, section_name in candidates:
+            if start >= last_end:
+                matches.append((start, end, section_name))
+                last_end = end
+        
+        return matches
+    
     def _extract_education(self, text: str) -> List[Dict[str, Any]]:
         """Extract education entries from text."""
         education = []
         
-        # Common degree patterns
-        degree_patterns = [
-            r"(?i)(bachelor|b\.?s\.?|b\.?a\.?|b\.?sc\.?)",
-            r"(?i)(master|m\.?s\.?|m\.?a\.?|m\.?sc\.?|mba)",
-            r"(?i)(ph\.?d\.?|doctorate|doctor)",
-            r"(?i)(associate|a\.?s\.?|a\.?a\.?)",
-            r"(?i)(diploma|certificate)"
-        ]
-        
-        # Year pattern
-        year_pattern = r"20\d{2}|19\d{2}"
-        
         # Find degrees
-        for pattern in degree_patterns:
-            matches = re.finditer(pattern, text)
+        for pattern in self._DEGREE_RES:
+            matches = pattern.finditer(text)
             for match in matches:
                 # Get surrounding context
                 start = max(0, match.start() - 50)
@@ -180,7 +309,7 @@ class ResumeParserService:
                 context = text[start:end]
                 
                 # Find year
-                year_match = re.search(year_pattern, context)
+                year_match = self._GRADUATION_YEAR_RE.search(context)
                 
                 education.append({
                     "degree": match.group(),
@@ -194,10 +323,7 @@ class ResumeParserService:
         """Extract work history from text."""
         work_history = []
         
-        # Date pattern for work experience
-        date_pattern = r"((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|\d{4})\s*[-–]\s*((?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}|\d{4}|Present|Current)"
-        
-        matches = list(re.finditer(date_pattern, text, re.IGNORECASE))
+        matches = list(self._WORK_DATES_RE.finditer(text))
         
         for i, match in enumerate(matches):
             start_date = match.group(1)
@@ -251,7 +377,7 @@ class ResumeParserService:
             return None
         
         # Try year only
-        year_match = re.search(r'(\d{4})', date_str)
+        year_match = self._YEAR_RE.search(date_str)
         if year_match:
             try:
                 return datetime.datetime(int(year_match.group(1)), 6, 1)
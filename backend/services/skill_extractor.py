@@ -6,16 +6,169 @@ Service for extracting skills from resume text using NLP.
 """
 
 import re
-from typing import List, Dict, Set
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Set, Iterable, Union
+import numpy as np
 from loguru import logger
 
-# Try to import NLP libraries
+@lru_cache(maxsize=1)
+def _get_nlp():
+    """Load the spaCy tokenizer on first use rather than at import time."""
+    try:
+        import spacy
+        # Skills are found by a token Matcher, so no tagger, parser or NER
+        # (and hence no trained model) is needed
+        return spacy.blank("en")
+    except (ImportError, OSError):
+        logger.warning("spaCy not available. Using keyword-based extraction.")
+        return None
+
 try:
-    import spacy
-    nlp = spacy.load("en_core_web_sm")
-except:
-    nlp = None
-    logger.warning("spaCy model not loaded. Using keyword-based extraction.")
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+    logger.warning("pyahocorasick not installed. Using per-skill regex matching.")
+
+
+# Whitespace other than single spaces: only there can the words of a
+# multi-word skill be split in a way the keyword scan misses
+_IRREGULAR_SPACE_RE = re.compile(r"[^\S ]|  ")
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the definition of \\w used by the re module."""
+    return char.isalnum() or char == "_"
+
+
+def _at_word_boundary(text: str, index: int) -> bool:
+    """Emulate the regex \\b assertion at a position in text."""
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _compile_skills_pattern(skills) -> re.Pattern:
+    """
+    Compile one alternation that finds every skill in a single scan.
+    
+    Longest skills come first so each position reports its longest match;
+    the lookahead keeps the match zero-width so hits may overlap. Skills and
+    the scanned text are both lowercase, so no case folding is needed.
+    """
+    alternation = "|".join(re.escape(s) for s in sorted(skills, key=len, reverse=True))
+    return re.compile(r"(?=\b(" + alternation + r")\b)")
+
+
+def _build_skill_variants(skills, aliases: Dict[str, str], min_alias_length: int) -> Dict[str, str]:
+    """
+    Map every surface form worth matching (known skills and their aliases)
+    to the canonical skill name that should be reported for it.
+    
+    Aliases that are not skills themselves are only matched in free text
+    when at least min_alias_length characters long: short ones such as
+    "tf" also appear in unrelated words (tf-idf, file extensions).
+    """
+    variants = {skill: aliases.get(skill, skill) for skill in skills}
+    variants.update(
+        (alias, skill) for alias, skill in aliases.items()
+        if alias in variants or len(alias) >= min_alias_length
+    )
+    return variants
+
+
+def _build_nested_skills(skills) -> Dict[str, tuple]:
+    """
+    Map each skill to the shorter skills that are word-bounded prefixes of it,
+    e.g. "spring boot" -> ("spring",). These start at the same position as the
+    longer skill, so the alternation alone would report only the longer one.
+    """
+    nested = {}
+    for skill in skills:
+        prefixes = tuple(
+            other for other in skills
+            if len(other) < len(skill) and skill.startswith(other)
+            and _at_word_boundary(skill, len(other))
+        )
+        if prefixes:
+            nested[skill] = prefixes
+    return nested
+
+
+class SkillTrie:
+    """
+    Trie of tokenized skill phrases for single-pass keyword detection.
+    
+    Text is tokenized once and each token position walks the trie, so the
+    cost grows with the number of text tokens rather than the number of skills.
+    Multi-word phrases such as "machine learning" need no regex alternation.
+    """
+    
+    # Alphanumeric runs (with inner dots and trailing +/#), plus / and - as
+    # standalone tokens so "ci/cd" or "scikit-learn" tokenize consistently
+    TOKEN_RE = re.compile(r"[^\W_]+(?:\.[^\W_]+)*[+#]*|[/-]")
+    
+    _LEAF = ""
+    
+    def __init__(self, skills: Iterable[str]):
+        self._root: Dict[str, dict] = {}
+        for skill in skills:
+            self.add(skill)
+    
+    @classmethod
+    def tokenize(cls, text: str) -> List[str]:
+        """Lowercase and split text into trie tokens."""
+        return cls.TOKEN_RE.findall(text.lower())
+    
+    @classmethod
+    def tokenize_many(cls, texts: Iterable[str]) -> List[List[str]]:
+        """Tokenize a batch of texts; map keeps the per-text calls in C."""
+        return list(map(cls.TOKEN_RE.findall, map(str.lower, texts)))
+    
+    def add(self, skill: str):
+        """Insert a skill phrase."""
+        node = self._root
+        for token in self.tokenize(skill):
+            node = node.setdefault(token, {})
+        node[self._LEAF] = skill
+    
+    def __contains__(self, skill: str) -> bool:
+        """Check whether exactly this skill phrase was added."""
+        node = self._root
+        for token in self.tokenize(skill):
+            node = node.get(token)
+            if node is None:
+                return False
+        return self._LEAF in node
+    
+    def find(self, text: Union[str, List[str]]) -> Set[str]:
+        """
+        Find every known skill in text (or in pre-tokenized text).
+        
+        Returns:
+            Set of matched skill phrases as they were added
+        """
+        tokens = self.tokenize(text) if isinstance(text, str) else text
+        root = self._root
+        leaf = self._LEAF
+        found = set()
+        
+        for start, token in enumerate(tokens):
+            node = root.get(token)
+            i = start + 1
+            while node is not None:
+                if leaf in node:
+                    found.add(node[leaf])
+                if i == len(tokens):
+                    break
+                node = node.get(tokens[i])
+                i += 1
+        
+        return found
 
 
 class SkillExtractorService:
@@ -181,6 +334,83 @@ class SkillExtractorService:
         "tf": "tensorflow",
     }
     
+    # Flat lookup tables derived from SKILLS_DATABASE: skill -> id -> category id
+    SKILL_CATEGORIES = ("technical", "soft", "methodological", "other")
+    _OTHER_CATEGORY_ID = SKILL_CATEGORIES.index("other")
+    _CATEGORY_TO_ID = {category: i for i, category in enumerate(SKILL_CATEGORIES)}
+    _SKILL_TO_ID = {skill: i for i, skill in enumerate(SKILLS_DATABASE)}
+    _CATEGORY_ID = np.fromiter(
+        map(_CATEGORY_TO_ID.__getitem__, SKILLS_DATABASE.values()),
+        dtype=np.int8, count=len(SKILLS_DATABASE)
+    )
+    
+    # Shortest alias (outside SKILLS_DATABASE) that is specific enough to
+    # match in free text; shorter ones only normalize given skill names
+    TEXT_ALIAS_MIN_LENGTH = 4
+    
+    # Matched forms resolve straight to canonical names, so no alias pass is needed
+    _SKILL_VARIANTS = _build_skill_variants(SKILLS_DATABASE, SKILL_ALIASES, TEXT_ALIAS_MIN_LENGTH)
+    
+    # Single-scan regex used when pyahocorasick is unavailable
+    _SKILLS_RE = _compile_skills_pattern(_SKILL_VARIANTS)
+    _NESTED_SKILLS = _build_nested_skills(_SKILL_VARIANTS)
+    
+    # Multi-pattern automaton over all skill variants, built on first use
+    _automaton = None
+    
+    # spaCy Matcher over multi-word skill variants, built on first use
+    _spaced_matcher = None
+    
+    # Documents handed to spaCy per nlp.pipe batch
+    NLP_BATCH_SIZE = 64
+    
+    # NLP skills per text digest, so re-extracting a text skips the pipeline
+    NLP_CACHE_MAX_ENTRIES = 512
+    _nlp_cache: "OrderedDict[bytes, frozenset]" = OrderedDict()
+    _nlp_cache_lock = threading.Lock()
+    
+    @classmethod
+    def _get_automaton(cls):
+        """Build (once) the Aho-Corasick automaton of all known skills."""
+        if cls._automaton is None:
+            automaton = ahocorasick.Automaton()
+            for variant, skill in cls._SKILL_VARIANTS.items():
+                automaton.add_word(variant, (len(variant), skill))
+            automaton.make_automaton()
+            cls._automaton = automaton
+        return cls._automaton
+    
+    @classmethod
+    def _get_spaced_matcher(cls, nlp):
+        """
+        Build (once) a Matcher for multi-word skills whose words are split by
+        newlines, tabs or repeated spaces, one match id per canonical skill.
+        
+        Single-word variants are left to the keyword scan, which already
+        finds every exact variant string.
+        """
+        if cls._spaced_matcher is None:
+            from spacy.matcher import Matcher
+            
+            patterns: Dict[str, list] = {}
+            for variant, skill in cls._SKILL_VARIANTS.items():
+                if " " not in variant:
+                    continue
+                
+                # spaCy keeps extra whitespace as IS_SPACE tokens between words
+                pattern = []
+                for token in nlp.make_doc(variant):
+                    pattern.append({"LOWER": token.lower_})
+                    if token.whitespace_:
+                        pattern.append({"IS_SPACE": True, "OP": "*"})
+                patterns.setdefault(skill, []).append(pattern)
+            
+            matcher = Matcher(nlp.vocab)
+            for skill, skill_patterns in patterns.items():
+                matcher.add(skill, skill_patterns)
+            cls._spaced_matcher = matcher
+        return cls._spaced_matcher
+    
     async def extract(self, text: str) -> List[str]:
         """
         Extract skills from text.
@@ -194,97 +424,130 @@ class SkillExtractorService:
         if not text:
             return []
         
-        # Normalize text
-        text_lower = text.lower()
+        return (await self.extract_batch([text]))[0]
+    
+    async def extract_batch(self, texts: List[str]) -> List[List[str]]:
+        """
+        Extract skills from several texts, running spaCy over them as one batch.
         
-        # Extract using keyword matching
-        keyword_skills = self._extract_by_keywords(text_lower)
+        Args:
+            texts: Resume or job description texts
+            
+        Returns:
+            List of extracted skills for each text, in input order
+        """
+        # Matching and parsing are CPU-bound; keep them off the event loop
+        return await asyncio.to_thread(self._extract_batch_sync, texts)
+    
+    def _extract_batch_sync(self, texts: List[str]) -> List[List[str]]:
+        """Blocking body of extract_batch, run in a worker thread."""
+        # Extract using keyword matching on normalized text
+        found = [self._extract_by_keywords(text.lower()) if text else set() for text in texts]
         
-        # Extract using NLP if available
+        # spaCy only adds multi-word skills split by irregular whitespace, so
+        # texts with single spaces alone never reach it
+        indices = [i for i, text in enumerate(texts) if text and _IRREGULAR_SPACE_RE.search(text)]
+        nlp = _get_nlp() if indices else None
         if nlp:
-            nlp_skills = self._extract_by_nlp(text)
-            keyword_skills.update(nlp_skills)
-        
-        # Normalize and deduplicate
-        normalized = self._normalize_skills(keyword_skills)
+            nlp_results = self._extract_by_nlp(nlp, [texts[i] for i in indices])
+            for i, nlp_skills in zip(indices, nlp_results):
+                found[i].update(nlp_skills)
         
-        return list(normalized)
+        return [list(skills) for skills in found]
     
     def _extract_by_keywords(self, text: str) -> Set[str]:
         """Extract skills using keyword matching."""
         found_skills = set()
         
-        for skill in self.SKILLS_DATABASE.keys():
-            # Build regex pattern for the skill
-            # Handle special characters in skill names
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            
-            if re.search(pattern, text, re.IGNORECASE):
-                found_skills.add(skill)
+        if AHOCORASICK_AVAILABLE:
+            # Single pass over the text; keep hits that sit on word boundaries
+            for end, (length, skill) in self._get_automaton().iter(text):
+                start = end - length + 1
+                if _at_word_boundary(text, start) and _at_word_boundary(text, end + 1):
+                    found_skills.add(skill)
+            return found_skills
+        
+        variants = self._SKILL_VARIANTS
+        for match in self._SKILLS_RE.finditer(text):
+            variant = match.group(1)
+            found_skills.add(variants[variant])
+            found_skills.update(variants[nested] for nested in self._NESTED_SKILLS.get(variant, ()))
         
         return found_skills
     
-    def _extract_by_nlp(self, text: str) -> Set[str]:
-        """Extract skills using spaCy NLP."""
-        found_skills = set()
+    def _extract_by_nlp(self, nlp, texts: List[str]) -> List[Set[str]]:
+        """Extract multi-word skills split by irregular whitespace using spaCy."""
+        cache = SkillExtractorService._nlp_cache
+        keys = [hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest() for text in texts]
+        found_skills = [set() for _ in texts]
+        
+        # Only distinct texts not parsed recently go through the pipeline
+        misses: Dict[bytes, List[int]] = {}
+        with self._nlp_cache_lock:
+            for i, key in enumerate(keys):
+                if key in cache:
+                    cache.move_to_end(key)
+                    found_skills[i].update(cache[key])
+                else:
+                    misses.setdefault(key, []).append(i)
+        
+        if not misses:
+            return found_skills
         
         try:
-            doc = nlp(text)
+            matcher = self._get_spaced_matcher(nlp)
             
-            # Extract noun phrases as potential skills
-            for chunk in doc.noun_chunks:
-                chunk_text = chunk.text.lower().strip()
-                
-                # Check if it matches a known skill
-                if chunk_text in self.SKILLS_DATABASE:
-                    found_skills.add(chunk_text)
+            # Oversized documents would make spaCy reject the whole batch
+            docs = nlp.pipe(
+                (texts[indices[0]][:nlp.max_length] for indices in misses.values()),
+                batch_size=self.NLP_BATCH_SIZE
+            )
             
-            # Extract named entities
-            for ent in doc.ents:
-                ent_text = ent.text.lower().strip()
+            for (key, indices), doc in zip(misses.items(), docs):
+                # Match ids are the canonical skill names
+                doc_skills = {nlp.vocab.strings[match_id] for match_id, _, _ in matcher(doc)}
+                
+                for i in indices:
+                    found_skills[i].update(doc_skills)
                 
-                if ent_text in self.SKILLS_DATABASE:
-                    found_skills.add(ent_text)
+                with self._nlp_cache_lock:
+                    cache[key] = frozenset(doc_skills)
+                    if len(cache) > self.NLP_CACHE_MAX_ENTRIES:
+                        cache.popitem(last=False)
                     
         except Exception as e:
             logger.warning(f"NLP extraction error: {e}")
         
         return found_skills
     
-    def _normalize_skills(self, skills: Set[str]) -> Set[str]:
-        """Normalize skill names using aliases."""
-        normalized = set()
+    def _skill_category_id(self, skill: str) -> int:
+        """Map a skill (or alias) to its index in SKILL_CATEGORIES."""
+        skill_lower = skill.lower()
         
-        for skill in skills:
-            # Check if there's an alias
-            if skill in self.SKILL_ALIASES:
-                normalized.add(self.SKILL_ALIASES[skill])
-            else:
-                normalized.add(skill)
+        # Check alias first
+        skill_lower = self.SKILL_ALIASES.get(skill_lower, skill_lower)
         
-        return normalized
+        skill_id = self._SKILL_TO_ID.get(skill_lower)
+        if skill_id is None:
+            return self._OTHER_CATEGORY_ID
+        return int(self._CATEGORY_ID[skill_id])
     
     def get_skill_category(self, skill: str) -> str:
         """Get the category of a skill."""
-        skill_lower = skill.lower()
-        
-        # Check alias first
-        if skill_lower in self.SKILL_ALIASES:
-            skill_lower = self.SKILL_ALIASES[skill_lower]
-        
-        return self.SKILLS_DATABASE.get(skill_lower, "other")
+        return self.SKILL_CATEGORIES[self._skill_category_id(skill)]
     
     def categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
         """Categorize skills by type."""
-        categorized = {
-            "technical": [],
-            "soft": [],
-            "methodological": [],
-            "other": []
-        }
+        category_ids = np.fromiter(
+            map(self._skill_category_id, skills), dtype=np.int8, count=len(skills)
+        )
         
-        for skill in skills:
-            category = self.get_skill_category(skill)
-            categorized[category].append(skill)
+        # Group skill indices by category, keeping input order within each group
+        order = np.argsort(category_ids, kind="stable")
+        bounds = np.cumsum(np.bincount(category_ids, minlength=len(self.SKILL_CATEGORIES)))
+        groups = np.split(order, bounds[:-1])
         
-        return categorized
+        return {
+            category: [skills[i] for i in group]
+            for category, group in zip(self.SKILL_CATEGORIES, groups)
+        }
@@ -11,19 +11,24 @@ Scheduled task that:
 import asyncio
 import json
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 import sys
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import numpy as np
 from loguru import logger
 from services.job_scraper import JobScraperService
 from services.notification_service import NotificationService
-from database.connection import async_session_maker
+from services.skill_extractor import SkillTrie
+from database.connection import async_session_maker, engine
 from models import Job, Resume, User
-from sqlalchemy import select, and_
+from sqlalchemy import select, insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 
 
 class JobMonitor:
@@ -34,29 +39,7 @@ class JobMonitor:
     def __init__(self):
         self.scraper = JobScraperService()
         self.notifier = NotificationService()
-        self.seen_jobs: set = set()  # Track seen job URLs to avoid duplicates
-        self._load_seen_jobs()
-    
-    def _load_seen_jobs(self):
-        """Load previously seen jobs from cache file."""
-        cache_file = Path(__file__).parent.parent / "data" / "seen_jobs.json"
-        if cache_file.exists():
-            try:
-                with open(cache_file, 'r') as f:
-                    self.seen_jobs = set(json.load(f))
-                logger.info(f"Loaded {len(self.seen_jobs)} previously seen jobs")
-            except Exception as e:
-                logger.error(f"Error loading seen jobs: {e}")
-    
-    def _save_seen_jobs(self):
-        """Save seen jobs to cache file."""
-        cache_file = Path(__file__).parent.parent / "data" / "seen_jobs.json"
-        cache_file.parent.mkdir(exist_ok=True)
-        try:
-            with open(cache_file, 'w') as f:
-                json.dump(list(self.seen_jobs), f)
-        except Exception as e:
-            logger.error(f"Error saving seen jobs: {e}")
+        self._dedupe_index_ready: Optional[bool] = None
     
     async def get_user_skills(self, user_id: int = None) -> List[str]:
         """
@@ -99,47 +82,68 @@ class JobMonitor:
         logger.info(f"Matching against skills: {unique_skills[:10]}...")
         return unique_skills
     
-    def calculate_match_score(self, job: Dict, user_skills: List[str]) -> int:
+    def calculate_match_score(self, job: Dict, user_skills: List[str],
+                              user_trie: Optional[SkillTrie] = None) -> int:
         """
         Calculate how well a job matches user's skills.
         
+        Args:
+            job: Scraped job data
+            user_skills: User's skills
+            user_trie: Trie of the lowercased user skills, reused across jobs
+        
         Returns:
             Match score 0-100
         """
-        job_skills = job.get('skills_required', [])
-        job_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
-        
-        if not job_skills:
-            # Extract skills from description
-            job_skills = self.scraper.extract_skills_from_text(job_text)
+        return int(self.calculate_match_scores([job], user_skills, user_trie)[0])
+    
+    def calculate_match_scores(self, jobs: List[Dict], user_skills: List[str],
+                               user_trie: Optional[SkillTrie] = None) -> np.ndarray:
+        """
+        Calculate match scores for a batch of jobs.
         
-        # Start with base score for remote jobs (these are all remote-focused sources)
-        location = job.get('location', '').lower()
-        remote_option = job.get('remote_option', '').lower()
+        Per-job text work fills flat arrays; the scoring arithmetic then runs
+        once over the whole batch.
         
-        base_score = 30  # Base score
+        Returns:
+            Array of match scores 0-100, in job order
+        """
+        if user_trie is None:
+            user_trie = SkillTrie(s.lower() for s in user_skills)
         
-        # Remote bonus
-        if 'remote' in location or 'remote' in remote_option:
-            base_score += 20
+        matches = np.zeros(len(jobs), dtype=np.int64)
+        is_remote = np.zeros(len(jobs), dtype=bool)
+        is_local = np.zeros(len(jobs), dtype=bool)
         
-        # Islamabad/Pakistan bonus
-        if 'islamabad' in location or 'pakistan' in location:
-            base_score += 25
+        # Tokenize every job up front; both tries walk the same token lists
+        all_tokens = SkillTrie.tokenize_many(
+            f"{job.get('title', '')} {job.get('description', '')}" for job in jobs
+        )
         
-        # Count matching skills
-        matches = 0
-        for skill in user_skills:
-            skill_lower = skill.lower()
-            if skill_lower in job_text or skill_lower in [s.lower() for s in job_skills]:
-                matches += 1
+        for i, (job, job_tokens) in enumerate(zip(jobs, all_tokens)):
+            job_skills = job.get('skills_required', [])
+            
+            if not job_skills:
+                # Extract skills from description
+                job_skills = self.scraper.extract_skills_from_text(job_tokens)
+            
+            location = job.get('location', '').lower()
+            remote_option = job.get('remote_option', '').lower()
+            is_remote[i] = 'remote' in location or 'remote' in remote_option
+            is_local[i] = 'islamabad' in location or 'pakistan' in location
+            
+            # Count matching skills by walking the user-skill trie
+            matched = user_trie.find(job_tokens)
+            matched.update(s.lower() for s in job_skills if s in user_trie)
+            matches[i] = len(matched)
         
-        # Each skill match adds points
-        skill_score = min(50, matches * 10)  # Up to 50 points from skills
+        # Base score, plus remote and Islamabad/Pakistan bonuses
+        base_score = 30 + 20 * is_remote + 25 * is_local
         
-        total_score = min(100, base_score + skill_score)
+        # Each skill match adds points, up to 50 points from skills
+        skill_score = np.minimum(50, matches * 10)
         
-        return total_score
+        return np.minimum(100, base_score + skill_score)
     
     async def run_monitor(self, 
                            min_match_score: int = 40,
@@ -174,22 +178,15 @@ class JobMonitor:
         
         logger.info(f"Scraped {len(all_jobs)} total jobs")
         
-        # Filter to new jobs only
-        new_jobs = []
-        for job in all_jobs:
-            job_url = job.get('apply_url', '')
-            job_key = f"{job.get('title', '')}|{job.get('company', '')}|{job_url}"
-            
-            if job_key not in self.seen_jobs:
-                new_jobs.append(job)
-                self.seen_jobs.add(job_key)
+        # Filter to jobs not already stored
+        new_jobs = await self._filter_new_jobs(all_jobs)
         
         logger.info(f"Found {len(new_jobs)} new jobs")
         
         # Score jobs against user skills
+        scores = self.calculate_match_scores(new_jobs, user_skills)
         matching_jobs = []
-        for job in new_jobs:
-            score = self.calculate_match_score(job, user_skills)
+        for job, score in zip(new_jobs, scores.tolist()):
             job['match_score'] = score
             
             if score >= min_match_score:
@@ -212,9 +209,6 @@ class JobMonitor:
                 via_email=notify_email
             )
         
-        # Save seen jobs cache
-        self._save_seen_jobs()
-        
         end_time = datetime.utcnow()
         duration = (end_time - start_time).total_seconds()
         
@@ -242,43 +236,114 @@ class JobMonitor:
         
         return summary
     
+    @staticmethod
+    def _dedupe_key(job_data: Dict) -> Tuple[str, str, str]:
+        """(title, company, apply_url) exactly as stored, matching ix_jobs_dedupe."""
+        return (
+            job_data.get('title', 'Unknown')[:255],
+            job_data.get('company', 'Unknown')[:255],
+            (job_data.get('apply_url') or '')[:500]
+        )
+    
+    async def _filter_new_jobs(self, jobs: List[Dict]) -> List[Dict]:
+        """Drop jobs already in the database or repeated within this scrape."""
+        keys = [self._dedupe_key(job_data) for job_data in jobs]
+        existing = set()
+        
+        try:
+            async with async_session_maker() as session:
+                # Fetch existing jobs for all incoming URLs in one query
+                urls = list({key[2] for key in keys})
+                result = await session.execute(
+                    select(Job.title, Job.company, Job.apply_url).where(Job.apply_url.in_(urls))
+                )
+                existing = {tuple(row) for row in result.all()}
+        except Exception as e:
+            logger.error(f"Error checking stored jobs: {e}")
+        
+        new_jobs = []
+        for job_data, key in zip(jobs, keys):
+            if key not in existing:
+                existing.add(key)
+                new_jobs.append(job_data)
+        
+        return new_jobs
+    
+    async def _ensure_dedupe_index(self) -> bool:
+        """
+        Create ix_jobs_dedupe on databases whose jobs table predates it.
+        
+        Returns:
+            Whether the unique index is in place
+        """
+        if self._dedupe_index_ready is None:
+            index = next(ix for ix in Job.__table__.indexes if ix.name == "ix_jobs_dedupe")
+            try:
+                async with engine.begin() as conn:
+                    await conn.run_sync(index.create, checkfirst=True)
+                self._dedupe_index_ready = True
+            except IntegrityError:
+                logger.error(
+                    "Existing duplicate jobs prevent creating ix_jobs_dedupe; "
+                    "remove them to restore ON CONFLICT deduplication"
+                )
+                self._dedupe_index_ready = False
+        
+        return self._dedupe_index_ready
+    
+    @staticmethod
+    def _insert_skipping_duplicates(dialect_name: str):
+        """INSERT ... ON CONFLICT DO NOTHING for the engine's dialect."""
+        if dialect_name == "postgresql":
+            return postgresql_insert(Job).on_conflict_do_nothing()
+        return sqlite_insert(Job).on_conflict_do_nothing()
+    
     async def _store_jobs_in_db(self, jobs: List[Dict]) -> int:
-        """Store scraped jobs in the database."""
+        """Store scraped jobs in the database, skipping ones already stored."""
         stored = 0
+        if not jobs:
+            return stored
         
         try:
-            async with async_session_maker() as session:
-                for job_data in jobs:
-                    # Check if job already exists
-                    existing = await session.execute(
-                        select(Job).where(
-                            and_(
-                                Job.title == job_data.get('title'),
-                                Job.company == job_data.get('company'),
-                                Job.apply_url == job_data.get('apply_url')
-                            )
-                        )
-                    )
-                    
-                    if existing.scalar_one_or_none() is None:
-                        job = Job(
-                            title=job_data.get('title', 'Unknown')[:255],
-                            company=job_data.get('company', 'Unknown')[:255],
-                            description=job_data.get('description', '')[:5000],
-                            location=job_data.get('location', '')[:255],
-                            remote_option=job_data.get('remote_option', '')[:50],
-                            job_type=job_data.get('job_type', 'Full-time')[:50],
-                            skills_required=job_data.get('skills_required', []),
-                            salary_min=job_data.get('salary_min'),
-                            salary_max=job_data.get('salary_max'),
-                            apply_url=job_data.get('apply_url', '')[:500],
-                            source=job_data.get('source', '')[:100],
-                            is_active=1
-                        )
-                        session.add(job)
-                        stored += 1
-                
-                await session.commit()
+            if not await self._ensure_dedupe_index():
+                # No unique index to conflict on, so filter by lookup instead
+                jobs = await self._filter_new_jobs(jobs)
+        except Exception as e:
+            logger.error(f"Error checking jobs index: {e}")
+            return stored
+        
+        rows = []
+        for job_data in jobs:
+            title, company, apply_url = self._dedupe_key(job_data)
+            rows.append({
+                'title': title,
+                'company': company,
+                'description': job_data.get('description', '')[:5000],
+                'location': job_data.get('location', '')[:255],
+                'remote_option': job_data.get('remote_option', '')[:50],
+                'job_type': job_data.get('job_type', 'Full-time')[:50],
+                'skills_required': job_data.get('skills_required', []),
+                'salary_min': job_data.get('salary_min'),
+                'salary_max': job_data.get('salary_max'),
+                'apply_url': apply_url,
+                'source': job_data.get('source', '')[:100],
+                'is_active': 1
+            })
+        
+        if not rows:
+            return stored
+        
+        try:
+            async with engine.begin() as conn:
+                if self._dedupe_index_ready:
+                    # One executemany; the unique index makes the database skip
+                    # duplicates, and RETURNING counts the rows really inserted
+                    stmt = self._insert_skipping_duplicates(conn.dialect.name)
+                    result = await conn.execute(stmt.returning(Job.id), rows)
+                    stored = len(result.all())
+                else:
+                    await conn.execute(insert(Job), rows)
+                    stored = len(rows)
         except Exception as e:
             logger.error(f"Error storing jobs: {e}")
         
@@ -5,10 +5,23 @@ cur = conn.cursor()
 
 tables = ['users', 'resumes', 'jobs', 'matches', 'recommendations']
 
+# Fetch every column of every table in one query
+placeholders = ",".join("?" * len(tables))
+cur.execute(
+    f"""SELECT m.name, p.name, p.type, p."notnull", p.pk
+        FROM sqlite_master m JOIN pragma_table_info(m.name) p
+        WHERE m.type = 'table' AND m.name IN ({placeholders})
+        ORDER BY m.name, p.cid""",
+    tables
+)
+
+columns = {table: [] for table in tables}
+for table, *column in cur.fetchall():
+    columns[table].append(column)
+
 for table in tables:
     print(f"\n=== {table.upper()} ===")
-    cur.execute(f"PRAGMA table_info({table})")
-    for row in cur.fetchall():
-        print(f"  {row[1]:25} {row[2]:15} {'NOT NULL' if row[3] else ''} {'PK' if row[5] else ''}")
+    for name, col_type, notnull, pk in columns[table]:
+        print(f"  {name:25} {col_type:15} {'NOT NULL' if notnull else ''} {'PK' if pk else ''}")
 
 conn.close()
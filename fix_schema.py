@@ -4,7 +4,6 @@ This drops and recreates all tables using SQLAlchemy.
 """
 
 import asyncio
-import json
 from pathlib import Path
 import sys
 
@@ -12,6 +11,7 @@ import sys
 sys.path.insert(0, str(Path(__file__).parent / "backend"))
 
 from database.connection import engine, Base
+from database.seed import insert_seed_jobs
 from models import User, Resume, Job, Match, Recommendation
 from sqlalchemy import text
 
@@ -37,43 +37,11 @@ async def fix_schema():
         print(f"Seed file not found: {seed_file}")
         return
     
-    with open(seed_file, "r") as f:
-        jobs_data = json.load(f)
-    
-    print(f"Loaded {len(jobs_data)} jobs from seed file")
-    
-    # Insert using raw SQL to avoid any ORM issues
+    # Stream rows into executemany batches inside one transaction
     async with engine.begin() as conn:
-        for job_data in jobs_data:
-            skills_json = json.dumps(job_data.get("skills_required", []))
-            await conn.execute(text("""
-                INSERT INTO jobs 
-                (title, company, description, requirements, skills_required, 
-                 experience_required, education_required, location, job_type, 
-                 remote_option, salary_min, salary_max, salary_currency, 
-                 is_active, apply_url)
-                VALUES 
-                (:title, :company, :description, :requirements, :skills,
-                 :experience, :education, :location, :job_type,
-                 :remote_option, :salary_min, :salary_max, 'USD',
-                 1, :apply_url)
-            """), {
-                "title": job_data["title"],
-                "company": job_data["company"],
-                "description": job_data.get("description", "No description"),
-                "requirements": job_data.get("requirements"),
-                "skills": skills_json,
-                "experience": job_data.get("experience_required"),
-                "education": job_data.get("education_required"),
-                "location": job_data.get("location"),
-                "job_type": job_data.get("job_type"),
-                "remote_option": job_data.get("remote_option"),
-                "salary_min": job_data.get("salary_min"),
-                "salary_max": job_data.get("salary_max"),
-                "apply_url": job_data.get("apply_url")
-            })
+        inserted = await insert_seed_jobs(conn, seed_file, "No description")
     
-    print(f"Inserted {len(jobs_data)} jobs")
+    print(f"Inserted {inserted} jobs from seed file")
     
     # Verify
     async with engine.begin() as conn:
@@ -5,8 +5,12 @@ Sentence Embedder Module
 Embedding generation using Sentence Transformers.
 """
 
+import math
+import hashlib
+import logging
+from collections import OrderedDict
 import numpy as np
-from typing import List, Optional, Union
+from typing import List, Optional, Union, Tuple
 import os
 
 # Try to import sentence-transformers
@@ -16,6 +20,23 @@ try:
 except ImportError:
     SENTENCE_TRANSFORMERS_AVAILABLE = False
 
+# Try to import SimSIMD for hand-vectorized pairwise cosine
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+_log = logging.getLogger(__name__)
+
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    """Vectorized SplitMix64 finalizer: a counter-based 64-bit hash."""
+    z = x + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
 
 class SentenceEmbedder:
     """
@@ -27,17 +48,33 @@ class SentenceEmbedder:
     - Good quality for semantic similarity
     """
     
-    # Singleton instances for different models
+    # Singleton instances for different models; ONNX ones keyed (model, "onnx")
     _instances = {}
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    # Dynamically int8-quantized ONNX export shipped with the hub models;
+    # the AVX2 build runs on any x86-64 CPU from the last decade
+    ONNX_QUANTIZED_FILE = "onnx/model_quint8_avx2.onnx"
+    
+    # Embeddings by (model, normalize, SHA-256 of text), shared across instances
+    EMBEDDING_CACHE_MAX_ENTRIES = 10_000
+    _embedding_cache: "OrderedDict[Tuple[str, bool, bytes], np.ndarray]" = OrderedDict()
+    
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        backend: Optional[str] = None
+    ):
         """
         Initialize embedder with specified model.
         
         Args:
             model_name: Name of the sentence-transformer model
+            backend: "torch", or "onnx" to run the int8-quantized model on
+                ONNX Runtime (needs sentence-transformers[onnx]>=3.2).
+                Defaults to the EMBEDDING_BACKEND env var, else "torch".
         """
         self.model_name = model_name
+        self.backend = backend or os.getenv("EMBEDDING_BACKEND", "torch")
         self.model = None
         self.embedding_dim = 384  # Default for MiniLM
         
@@ -47,21 +84,43 @@ class SentenceEmbedder:
     def _load_model(self):
         """Load the sentence transformer model."""
         try:
-            # Check if model already loaded in singleton
-            if self.model_name in SentenceEmbedder._instances:
-                self.model = SentenceEmbedder._instances[self.model_name]
-            else:
-                print(f"Loading embedding model: {self.model_name}")
-                self.model = SentenceTransformer(self.model_name)
-                SentenceEmbedder._instances[self.model_name] = self.model
+            if self.backend == "onnx" and self._load_onnx_model() is None:
+                self.backend = "torch"
+            
+            if self.backend != "onnx":
+                # Check if model already loaded in singleton
+                if self.model_name in SentenceEmbedder._instances:
+                    self.model = SentenceEmbedder._instances[self.model_name]
+                else:
+                    _log.info("Loading embedding model: %s", self.model_name)
+                    self.model = SentenceTransformer(self.model_name)
+                    SentenceEmbedder._instances[self.model_name] = self.model
             
             self.embedding_dim = self.model.get_sentence_embedding_dimension()
-            print(f"Model loaded. Embedding dimension: {self.embedding_dim}")
+            _log.info("Model loaded. Embedding dimension: %d", self.embedding_dim)
             
         except Exception as e:
-            print(f"Failed to load model: {e}")
+            _log.warning("Failed to load model: %s", e)
             self.model = None
     
+    def _load_onnx_model(self):
+        """Load the quantized ONNX model; returns None if it is unavailable."""
+        instance_key = (self.model_name, "onnx")
+        if instance_key not in SentenceEmbedder._instances:
+            try:
+                _log.info("Loading quantized ONNX embedding model: %s", self.model_name)
+                SentenceEmbedder._instances[instance_key] = SentenceTransformer(
+                    self.model_name,
+                    backend="onnx",
+                    model_kwargs={"file_name": self.ONNX_QUANTIZED_FILE}
+                )
+            except Exception as e:
+                _log.warning("Failed to load ONNX model, using torch backend: %s", e)
+                return None
+        
+        self.model = SentenceEmbedder._instances[instance_key]
+        return self.model
+    
     def encode(
         self,
         texts: Union[str, List[str]],
@@ -87,35 +146,104 @@ class SentenceEmbedder:
         if not texts:
             return np.array([])
         
-        if self.model is None:
-            # Fallback to random embeddings
-            return self._fallback_encode(texts)
+        cache = SentenceEmbedder._embedding_cache
+        namespace = self._cache_namespace()
+        keys = [
+            (namespace, normalize, hashlib.sha256(text.encode()).digest())
+            for text in texts
+        ]
         
-        embeddings = self.model.encode(
-            texts,
-            batch_size=batch_size,
-            show_progress_bar=show_progress,
-            convert_to_numpy=True,
-            normalize_embeddings=normalize
-        )
+        # Only texts not encoded recently go through the model
+        misses = {}
+        for i, key in enumerate(keys):
+            if key in cache:
+                cache.move_to_end(key)
+            else:
+                misses.setdefault(key, i)
+        
+        if misses:
+            miss_texts = [texts[i] for i in misses.values()]
+            
+            if self.model is None:
+                # Fallback to random embeddings
+                encoded = self._fallback_encode(miss_texts)
+            else:
+                # SentenceTransformer.encode already sorts texts by length
+                # before batching and restores input order, so mini-batches
+                # pad to similar lengths without reordering here
+                encoded = self.model.encode(
+                    miss_texts,
+                    batch_size=batch_size,
+                    show_progress_bar=show_progress,
+                    convert_to_numpy=True,
+                    normalize_embeddings=normalize
+                )
+            
+            for key, embedding in zip(misses, encoded):
+                cache[key] = embedding.copy()
+        
+        embeddings = np.stack([cache[key] for key in keys])
+        
+        while len(cache) > self.EMBEDDING_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
         
         return embeddings
     
+    def _cache_namespace(self) -> str:
+        """Name embeddings by the model that produced them (or the fallback)."""
+        if self.model is None:
+            return "fallback"
+        # Quantized embeddings differ slightly, so keep them apart
+        return f"{self.model_name}/onnx" if self.backend == "onnx" else self.model_name
+    
+    def save_cache(self, path: str):
+        """Save this model's cached embeddings to an .npz file keyed by text digest."""
+        namespace = self._cache_namespace()
+        entries = {
+            f"{int(normalize)}_{digest.hex()}": embedding
+            for (ns, normalize, digest), embedding in SentenceEmbedder._embedding_cache.items()
+            if ns == namespace
+        }
+        np.savez(path, **entries)
+    
+    def load_cache(self, path: str):
+        """Load embeddings saved by save_cache into the in-memory cache."""
+        namespace = self._cache_namespace()
+        cache = SentenceEmbedder._embedding_cache
+        with np.load(path) as data:
+            for name in data.files:
+                normalize, digest = name.split("_", 1)
+                cache[(namespace, normalize == "1", bytes.fromhex(digest))] = data[name]
+        
+        while len(cache) > self.EMBEDDING_CACHE_MAX_ENTRIES:
+            cache.popitem(last=False)
+    
     def _fallback_encode(self, texts: List[str]) -> np.ndarray:
-        """Generate deterministic fallback embeddings."""
-        import hashlib
+        """
+        Generate deterministic fallback embeddings.
         
-        embeddings = []
-        for text in texts:
-            # Create deterministic embedding from text hash
-            text_hash = hashlib.sha256(text.encode()).hexdigest()
-            rng = np.random.RandomState(int(text_hash[:8], 16) % (2**31))
-            embedding = rng.randn(self.embedding_dim).astype(np.float32)
-            # Normalize
-            embedding = embedding / (np.linalg.norm(embedding) + 1e-8)
-            embeddings.append(embedding)
+        Each row depends only on its own text: hashing (text seed, column)
+        gives uniform bits that a Box-Muller transform turns into Gaussians,
+        so the whole batch is built in a few vectorized passes.
+        """
+        # Seed each row from the first 8 bytes of its text's SHA-256
+        digests = b"".join(hashlib.sha256(text.encode()).digest() for text in texts)
+        seeds = np.frombuffer(digests, dtype=">u8")[::4].astype(np.uint64)
+        
+        half = (self.embedding_dim + 1) // 2
+        bits = _splitmix64(seeds[:, None] + np.arange(2 * half, dtype=np.uint64))
         
-        return np.array(embeddings)
+        # Top 53 bits -> uniform floats in (0, 1)
+        uniform = ((bits >> np.uint64(11)).astype(np.float64) + 0.5) * 2.0 ** -53
+        radius = np.sqrt(-2.0 * np.log(uniform[:, :half]))
+        theta = 2.0 * np.pi * uniform[:, half:]
+        embeddings = np.concatenate(
+            [radius * np.cos(theta), radius * np.sin(theta)], axis=1
+        )[:, :self.embedding_dim].astype(np.float32)
+        
+        # Normalize
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-8
+        return embeddings
     
     def similarity(
         self,
@@ -132,22 +260,31 @@ class SentenceEmbedder:
         Returns:
             Similarity score (0-1)
         """
-        # Normalize if not already
-        norm1 = np.linalg.norm(embedding1)
-        norm2 = np.linalg.norm(embedding2)
+        if SIMSIMD_AVAILABLE:
+            a = np.ascontiguousarray(embedding1, dtype=np.float32)
+            b = np.ascontiguousarray(embedding2, dtype=np.float32)
+            if not a.any() or not b.any():
+                return 0.0
+            
+            # SimSIMD returns cosine distance, i.e. 1 - similarity
+            return float((2.0 - simsimd.cosine(a, b)) * 0.5)
+        
+        # Squared norms via vdot skip np.linalg.norm's dispatch overhead
+        denom = math.sqrt(np.vdot(embedding1, embedding1) * np.vdot(embedding2, embedding2))
         
-        if norm1 == 0 or norm2 == 0:
+        if denom == 0:
             return 0.0
         
-        similarity = np.dot(embedding1, embedding2) / (norm1 * norm2)
+        similarity = np.dot(embedding1, embedding2) / denom
         
         # Scale to 0-1 range
-        return float((similarity + 1) / 2)
+        return float((similarity + 1) * 0.5)
     
     def batch_similarity(
         self,
         query: np.ndarray,
-        corpus: np.ndarray
+        corpus: np.ndarray,
+        normalized: bool = False
     ) -> np.ndarray:
         """
         Compute similarity between query and all corpus embeddings.
@@ -155,20 +292,68 @@ class SentenceEmbedder:
         Args:
             query: Query embedding (1D)
             corpus: Corpus embeddings (2D)
+            normalized: True if corpus came from normalize_corpus, which
+                skips re-normalizing a corpus that is scored repeatedly
             
         Returns:
             Array of similarity scores
         """
-        # Normalize
-        query_norm = query / (np.linalg.norm(query) + 1e-8)
-        corpus_norms = np.linalg.norm(corpus, axis=1, keepdims=True) + 1e-8
-        corpus_normalized = corpus / corpus_norms
+        # Int8 corpora (see quantize) go through SimSIMD's integer cosine kernel
+        if SIMSIMD_AVAILABLE and corpus.dtype == np.int8:
+            query_i8, _ = self.quantize(np.asarray(query)[None, :])
+            distances = np.asarray(simsimd.cdist(query_i8, corpus, metric="cosine"))[0]
+            return 0.5 * (2.0 - distances)
+        
+        corpus_unit = corpus if normalized else self.normalize_corpus(corpus)
+        
+        query = np.asarray(query, dtype=np.float32)
+        query_unit = query / (np.linalg.norm(query) + 1e-8)
+        
+        # Single matrix-vector product (BLAS sgemv), scaled to 0-1 in place
+        scores = corpus_unit @ query_unit
+        scores *= 0.5
+        scores += 0.5
+        return scores
+    
+    @staticmethod
+    def quantize(corpus: np.ndarray):
+        """
+        Quantize embeddings to int8, scaling each row so its largest
+        magnitude maps to 127. Cosine similarity is unaffected by the
+        per-row scale, so the int8 corpus can be passed to batch_similarity.
         
-        # Compute dot product
-        similarities = np.dot(corpus_normalized, query_norm)
+        Args:
+            corpus: Corpus embeddings (2D)
+            
+        Returns:
+            Tuple of (int8 corpus, per-row float32 scales with row ~= q * scale)
+        """
+        corpus = np.asarray(corpus, dtype=np.float32)
+        scales = np.abs(corpus).max(axis=1, keepdims=True) / 127.0
+        scales[scales == 0] = 1.0
+        quantized = np.rint(corpus / scales).astype(np.int8)
+        return np.ascontiguousarray(quantized), scales.ravel()
+    
+    @staticmethod
+    def normalize_corpus(corpus: np.ndarray) -> np.ndarray:
+        """
+        L2-normalize corpus rows into a float32 C-contiguous matrix.
+        
+        Args:
+            corpus: Corpus embeddings (2D)
+            
+        Returns:
+            Unit-length rows, laid out for BLAS; pass them to
+            batch_similarity with normalized=True
+        """
+        corpus = np.asarray(corpus)
+        norms = np.linalg.norm(corpus, axis=1, keepdims=True)
+        norms += 1e-8
         
-        # Scale to 0-1
-        return (similarities + 1) / 2
+        # Divide straight into the float32 result; no intermediate copies
+        unit = np.empty(corpus.shape, dtype=np.float32)
+        np.divide(corpus, norms, out=unit)
+        return unit
     
     def save_embeddings(self, embeddings: np.ndarray, path: str):
         """Save embeddings to file."""
@@ -179,6 +364,9 @@ class SentenceEmbedder:
         return np.load(path)
 
 
-def get_embedder(model_name: str = "all-MiniLM-L6-v2") -> SentenceEmbedder:
+def get_embedder(
+    model_name: str = "all-MiniLM-L6-v2",
+    backend: Optional[str] = None
+) -> SentenceEmbedder:
     """Get or create embedder instance."""
-    return SentenceEmbedder(model_name)
+    return SentenceEmbedder(model_name, backend)
@@ -5,7 +5,7 @@ Model Evaluator Module
 Evaluation and metrics for ML models.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import numpy as np
 
 try:
@@ -140,24 +140,33 @@ class ModelEvaluator:
         if thresholds is None:
             thresholds = [0.3, 0.4, 0.5, 0.6, 0.7]
         
-        results = {
-            "threshold": [],
-            "precision": [],
-            "recall": [],
-            "f1": [],
-            "accuracy": []
+        y_true = np.asarray(y_true) == 1
+        y_prob = np.asarray(y_prob, dtype=np.float64)
+        thresh = np.asarray(thresholds, dtype=np.float64)
+        
+        # Sort once; predicted positives at a threshold are the probs >= it
+        n_pos = int(y_true.sum())
+        n = y_true.size
+        all_sorted = np.sort(y_prob)
+        pos_sorted = np.sort(y_prob[y_true])
+        pred_pos = n - np.searchsorted(all_sorted, thresh, side="left")
+        tp = n_pos - np.searchsorted(pos_sorted, thresh, side="left")
+        tn = (n - n_pos) - (pred_pos - tp)
+        
+        # Same zero_division=0 convention as the sklearn scorers
+        with np.errstate(divide="ignore", invalid="ignore"):
+            precision = np.where(pred_pos > 0, tp / pred_pos, 0.0)
+            recall = np.where(n_pos > 0, tp / max(n_pos, 1), 0.0)
+            f1 = np.where(pred_pos + n_pos > 0, 2 * tp / (pred_pos + n_pos), 0.0)
+        accuracy = (tp + tn) / n
+        
+        return {
+            "threshold": list(thresholds),
+            "precision": precision.tolist(),
+            "recall": recall.tolist(),
+            "f1": f1.tolist(),
+            "accuracy": accuracy.tolist()
         }
-        
-        for thresh in thresholds:
-            y_pred = (y_prob >= thresh).astype(int)
-            
-            results["threshold"].append(thresh)
-            results["precision"].append(precision_score(y_true, y_pred, zero_division=0))
-            results["recall"].append(recall_score(y_true, y_pred, zero_division=0))
-            results["f1"].append(f1_score(y_true, y_pred, zero_division=0))
-            results["accuracy"].append(accuracy_score(y_true, y_pred))
-        
-        return results
     
     def find_optimal_threshold(
         self,
@@ -176,26 +185,18 @@ class ModelEvaluator:
         Returns:
             Tuple of (optimal_threshold, metric_value)
         """
-        best_threshold = 0.5
-        best_score = 0
+        if metric not in ("f1", "precision", "recall"):
+            raise ValueError(f"Unknown metric: {metric}")
         
-        for thresh in np.arange(0.1, 0.9, 0.05):
-            y_pred = (y_prob >= thresh).astype(int)
-            
-            if metric == "f1":
-                score = f1_score(y_true, y_pred, zero_division=0)
-            elif metric == "precision":
-                score = precision_score(y_true, y_pred, zero_division=0)
-            elif metric == "recall":
-                score = recall_score(y_true, y_pred, zero_division=0)
-            else:
-                raise ValueError(f"Unknown metric: {metric}")
-            
-            if score > best_score:
-                best_score = score
-                best_threshold = thresh
+        # Score every candidate from one sort of y_prob
+        thresholds = np.arange(0.1, 0.9, 0.05)
+        scores = self.get_threshold_analysis(y_true, y_prob, thresholds)[metric]
+        
+        best = int(np.argmax(scores))
+        if scores[best] <= 0:
+            return 0.5, 0
         
-        return best_threshold, best_score
+        return thresholds[best], scores[best]
 
 
 def print_evaluation_report(metrics: Dict[str, Any], model_name: str = "Model"):
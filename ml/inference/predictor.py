@@ -6,6 +6,8 @@ Inference pipeline for resume-job matching.
 """
 
 import os
+import json
+import logging
 from typing import Dict, Any, List, Optional, Tuple
 import numpy as np
 
@@ -18,6 +20,8 @@ except ImportError:
 from ml.preprocessing.feature_engineer import FeatureEngineer
 from ml.embeddings.sentence_embedder import SentenceEmbedder
 
+_log = logging.getLogger(__name__)
+
 
 class MatchPredictor:
     """
@@ -29,7 +33,8 @@ class MatchPredictor:
         self,
         model_path: Optional[str] = None,
         scaler_path: Optional[str] = None,
-        use_embeddings: bool = True
+        use_embeddings: bool = True,
+        scaled_input: Optional[bool] = None
     ):
         """
         Initialize predictor.
@@ -38,9 +43,18 @@ class MatchPredictor:
             model_path: Path to trained model file
             scaler_path: Path to fitted scaler file
             use_embeddings: Whether to use embedding-based features
+            scaled_input: Whether the model was trained on scaled features.
+                By default it is read from best_model_info.json next to the
+                model; without that, only a model shipped with a scaler is
+                assumed to be scaled
         """
         self.feature_engineer = FeatureEngineer()
         self.use_embeddings = use_embeddings
+        if scaled_input is None:
+            scaled_input = self._saved_scaled_input(model_path)
+        if scaled_input is None:
+            scaled_input = scaler_path is not None
+        self.scaled_input = scaled_input
         
         if use_embeddings:
             self.embedder = SentenceEmbedder()
@@ -56,13 +70,55 @@ class MatchPredictor:
         if scaler_path and os.path.exists(scaler_path):
             self.load_scaler(scaler_path)
     
+    @staticmethod
+    def _saved_scaled_input(model_path: Optional[str]) -> Optional[bool]:
+        """
+        Look up whether a trainer-saved model expects scaled features.
+        
+        ModelTrainer.save_models writes "<prefix><name>_<timestamp>.joblib"
+        per model and "<prefix>best_model_info.json" describing the run.
+        
+        Returns:
+            The saved flag, or None if no info file describes this model
+        """
+        if not model_path:
+            return None
+        
+        model_dir = os.path.dirname(model_path) or "."
+        model_file = os.path.basename(model_path)
+        suffix = "best_model_info.json"
+        try:
+            info_files = [f for f in os.listdir(model_dir) if f.endswith(suffix)]
+        except OSError:
+            return None
+        
+        for info_file in info_files:
+            try:
+                with open(os.path.join(model_dir, info_file)) as f:
+                    info = json.load(f)
+            except (OSError, ValueError):
+                continue
+            
+            prefix = info_file[:-len(suffix)]
+            run_suffix = f"_{info.get('timestamp')}.joblib"
+            if not (model_file.startswith(prefix) and model_file.endswith(run_suffix)):
+                continue
+            
+            name = model_file[len(prefix):-len(run_suffix)]
+            if name == info.get("best_model"):
+                return info.get("scaled_input")
+            if "scaled_models" in info:
+                return name in info["scaled_models"]
+        
+        return None
+    
     def load_model(self, path: str):
         """Load trained model from disk."""
         if not JOBLIB_AVAILABLE:
             raise ImportError("joblib is required to load models")
         
         self.model = joblib.load(path)
-        print(f"Model loaded from {path}")
+        _log.info("Model loaded from %s", path)
     
     def load_scaler(self, path: str):
         """Load fitted scaler from disk."""
@@ -70,12 +126,13 @@ class MatchPredictor:
             raise ImportError("joblib is required to load scaler")
         
         self.scaler = joblib.load(path)
-        print(f"Scaler loaded from {path}")
+        _log.info("Scaler loaded from %s", path)
     
     def predict(
         self,
         resume_data: Dict[str, Any],
-        job_data: Dict[str, Any]
+        job_data: Dict[str, Any],
+        embedding_score: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Predict match score for resume-job pair.
@@ -83,68 +140,22 @@ class MatchPredictor:
         Args:
             resume_data: Resume information
             job_data: Job information
+            embedding_score: Precomputed semantic similarity; skips encoding
             
         Returns:
             Prediction results with scores and explanation
         """
-        # Extract features
-        features = self.feature_engineer.extract_features(resume_data, job_data)
-        feature_vector = self.feature_engineer.features_to_vector(features)
-        
-        # Calculate embedding-based similarity
-        embedding_score = 0.0
-        if self.use_embeddings and self.embedder:
-            embedding_score = self._calculate_embedding_similarity(
-                resume_data.get("raw_text", ""),
-                job_data.get("description", "")
-            )
+        # Calculate embedding-based similarity unless precomputed
+        if embedding_score is None:
+            embedding_score = 0.0
+            if self.use_embeddings and self.embedder:
+                embedding_score = self._calculate_embedding_similarity(
+                    resume_data.get("raw_text", ""),
+                    job_data.get("description", "")
+                )
         
-        # Model prediction
-        if self.model is not None:
-            # Scale features
-            if self.scaler is not None:
-                feature_vector = self.scaler.transform([feature_vector])[0]
-            
-            # Get prediction and probability
-            prediction = self.model.predict([feature_vector])[0]
-            
-            if hasattr(self.model, 'predict_proba'):
-                proba = self.model.predict_proba([feature_vector])[0]
-                confidence = max(proba)
-                match_probability = proba[1] if len(proba) > 1 else proba[0]
-            else:
-                confidence = 0.8
-                match_probability = float(prediction)
-        else:
-            # Fallback: rule-based scoring
-            skill_score = features["skill_overlap_ratio"]
-            exp_score = features["experience_ratio"]
-            edu_score = features["education_level_ratio"]
-            
-            match_probability = (
-                0.5 * skill_score +
-                0.2 * exp_score +
-                0.1 * edu_score +
-                0.2 * embedding_score
-            )
-            prediction = 1 if match_probability >= 0.5 else 0
-            confidence = abs(match_probability - 0.5) * 2
-        
-        # Combine scores
-        overall_score = (
-            0.6 * match_probability +
-            0.4 * embedding_score
-        ) * 100
-        
-        return {
-            "match": bool(prediction),
-            "overall_score": round(overall_score, 2),
-            "match_probability": round(match_probability, 4),
-            "semantic_similarity": round(embedding_score, 4),
-            "confidence": round(confidence, 4),
-            "features": features,
-            "explanation": self._generate_explanation(features, overall_score)
-        }
+        features = self.feature_engineer.extract_features(resume_data, job_data)
+        return self._predict_from_features([features], [embedding_score])[0]
     
     def predict_batch(
         self,
@@ -161,19 +172,122 @@ class MatchPredictor:
         Returns:
             List of predictions sorted by score
         """
-        predictions = []
+        # Encode the resume and all job descriptions in one batch
+        embedding_scores = [0.0] * len(jobs)
+        if self.use_embeddings and self.embedder:
+            embedding_scores = self._calculate_embedding_similarities(
+                resume_data.get("raw_text", ""),
+                [job.get("description", "") for job in jobs]
+            ).tolist()
+        
+        # Extract features column-wise for all jobs, then split into rows
+        names = self.feature_engineer.FEATURE_NAMES
+        columns = self.feature_engineer.extract_features_batch(resume_data, jobs)
+        X = np.column_stack([columns[name] for name in names]).astype(np.float64)
+        features_list = [
+            dict(zip(names, row))
+            for row in zip(*(columns[name].tolist() for name in names))
+        ]
+        
+        # Score every job with one model call; sklearn parallelizes inside
+        # it (n_jobs, BLAS), and the rest is GIL-bound Python that a thread
+        # pool over jobs would only serialize
+        predictions = self._predict_from_features(features_list, embedding_scores, X)
         
-        for i, job in enumerate(jobs):
-            pred = self.predict(resume_data, job)
+        for i, (pred, job) in enumerate(zip(predictions, jobs)):
             pred["job_index"] = i
             pred["job_id"] = job.get("id")
-            predictions.append(pred)
         
         # Sort by score
         predictions.sort(key=lambda x: x["overall_score"], reverse=True)
         
         return predictions
     
+    def _predict_from_features(
+        self,
+        features_list: List[Dict[str, float]],
+        embedding_scores: List[float],
+        X: Optional[np.ndarray] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Turn extracted features into predictions, in input order.
+        
+        The feature vectors are stacked into one matrix so the scaler and
+        model each run once for the whole batch.
+        
+        Args:
+            features_list: Extracted features per resume-job pair
+            embedding_scores: Semantic similarity per pair
+            X: Feature matrix matching features_list, if already built
+            
+        Returns:
+            Prediction results with scores and explanation
+        """
+        if not features_list:
+            return []
+        
+        if self.model is not None:
+            if X is None:
+                X = np.empty((len(features_list), len(self.feature_engineer.FEATURE_NAMES)))
+                for row, features in zip(X, features_list):
+                    self.feature_engineer.features_to_vector(features, out=row)
+            
+            # Scale features
+            if self.scaler is not None and self.scaled_input:
+                X = self.scaler.transform(X)
+            
+            # Get predictions and probabilities
+            predictions = self.model.predict(X).tolist()
+            
+            if hasattr(self.model, 'predict_proba'):
+                proba = self.model.predict_proba(X)
+                confidences = proba.max(axis=1).tolist()
+                match_probabilities = (
+                    proba[:, 1] if proba.shape[1] > 1 else proba[:, 0]
+                ).tolist()
+            else:
+                confidences = [0.8] * len(predictions)
+                match_probabilities = [float(p) for p in predictions]
+        else:
+            predictions, confidences, match_probabilities = [], [], []
+            for features, embedding_score in zip(features_list, embedding_scores):
+                # Fallback: rule-based scoring
+                skill_score = features["skill_overlap_ratio"]
+                exp_score = features["experience_ratio"]
+                edu_score = features["education_level_ratio"]
+                
+                match_probability = (
+                    0.5 * skill_score +
+                    0.2 * exp_score +
+                    0.1 * edu_score +
+                    0.2 * embedding_score
+                )
+                predictions.append(1 if match_probability >= 0.5 else 0)
+                confidences.append(abs(match_probability - 0.5) * 2)
+                match_probabilities.append(match_probability)
+        
+        results = []
+        for features, embedding_score, prediction, match_probability, confidence in zip(
+            features_list, embedding_scores, predictions, match_probabilities, confidences
+        ):
+            # Combine scores
+            overall_score = (
+                0.6 * match_probability +
+                0.4 * embedding_score
+            ) * 100
+            
+            results.append({
+                "match": bool(prediction),
+                "overall_score": round(overall_score, 2),
+                "match_probability": round(match_probability, 4),
+                "semantic_similarity": round(embedding_score, 4),
+                "confidence": round(confidence, 4),
+                "features": features,
+                "explanation": self._generate_explanation(features, overall_score)
+            })
+        
+        return results
+    
     def _calculate_embedding_similarity(
         self,
         resume_text: str,
@@ -184,13 +298,40 @@ class MatchPredictor:
             return 0.5
         
         try:
-            embeddings = self.embedder.encode([resume_text, job_text])
-            similarity = self.embedder.similarity(embeddings[0], embeddings[1])
-            return similarity
-        except Exception as e:
-            print(f"Embedding error: {e}")
+            embeddings = self.embedder.encode([resume_text, job_text], normalize=True)
+            # Unit vectors, so the dot product is the cosine
+            return float((np.dot(embeddings[0], embeddings[1]) + 1) * 0.5)
+        except Exception:
+            _log.exception("Embedding error")
             return 0.5
     
+    def _calculate_embedding_similarities(
+        self,
+        resume_text: str,
+        job_texts: List[str]
+    ) -> np.ndarray:
+        """Calculate embedding-based similarity of one resume to many jobs."""
+        similarities = np.full(len(job_texts), 0.5)
+        if not resume_text:
+            return similarities
+        
+        indices = [i for i, text in enumerate(job_texts) if text]
+        if not indices:
+            return similarities
+        
+        try:
+            embeddings = self.embedder.encode(
+                [resume_text] + [job_texts[i] for i in indices],
+                batch_size=64,
+                normalize=True
+            )
+            # Unit vectors, so one matrix-vector product gives every cosine
+            similarities[indices] = 0.5 * (embeddings[1:] @ embeddings[0] + 1)
+        except Exception:
+            _log.exception("Embedding error")
+        
+        return similarities
+    
     def _generate_explanation(
         self,
         features: Dict[str, float],
@@ -249,7 +390,8 @@ class MatchPredictor:
 
 def get_predictor(
     model_path: Optional[str] = None,
-    scaler_path: Optional[str] = None
+    scaler_path: Optional[str] = None,
+    scaled_input: Optional[bool] = None
 ) -> MatchPredictor:
     """Factory function to create predictor instance."""
-    return MatchPredictor(model_path, scaler_path)
+    return MatchPredictor(model_path, scaler_path, scaled_input=scaled_input)
@@ -5,12 +5,15 @@ Preprocessing Package
 Text preprocessing and feature engineering modules.
 """
 
-from ml.preprocessing.text_cleaner import TextCleaner, clean_resume_text, clean_job_description
+from ml.preprocessing.text_cleaner import (
+    TextCleaner, clean_resume_text, clean_job_description, clean_text_cached
+)
 from ml.preprocessing.feature_engineer import FeatureEngineer
 
 __all__ = [
     "TextCleaner",
     "clean_resume_text",
     "clean_job_description",
+    "clean_text_cached",
     "FeatureEngineer"
 ]
@@ -6,19 +6,104 @@ Feature engineering utilities for ML pipeline.
 """
 
 import re
+from functools import lru_cache
+from itertools import repeat
 from typing import Dict, List, Any, Optional
 import numpy as np
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from ml.preprocessing.text_cleaner import TextCleaner
 
 
+def _sorted_intersection_count(a: np.ndarray, b: np.ndarray) -> int:
+    """Count values shared by two sorted, duplicate-free arrays."""
+    i = j = count = 0
+    while i < a.shape[0] and j < b.shape[0]:
+        if a[i] < b[j]:
+            i += 1
+        elif a[i] > b[j]:
+            j += 1
+        else:
+            count += 1
+            i += 1
+            j += 1
+    return count
+
+
+if NUMBA_AVAILABLE:
+    _sorted_intersection_count = njit(cache=True)(_sorted_intersection_count)
+
+
+def _token_hashes(text: str) -> np.ndarray:
+    """Sorted unique 64-bit hashes of the whitespace tokens in text."""
+    return np.unique(np.fromiter((hash(t) for t in text.split()), dtype=np.int64))
+
+
 class FeatureEngineer:
     """
     Feature engineering for resume-job matching ML models.
     """
     
+    CLEAN_CACHE_MAX_ENTRIES = 2048
+    
+    # Consistent feature order for vectors and model inputs
+    FEATURE_NAMES = (
+        "skill_overlap_ratio",
+        "skill_overlap_count",
+        "skill_gap_count",
+        "extra_skills_count",
+        "experience_ratio",
+        "experience_diff",
+        "experience_meets_req",
+        "experience_exceeds",
+        "text_jaccard_similarity",
+        "resume_length",
+        "job_length",
+        "common_tokens_count",
+        "education_level_ratio",
+        "education_meets_req",
+        "candidate_education_level",
+        "required_education_level"
+    )
+    
+    # Education level mapping
+    EDU_LEVELS = {
+        "high school": 1,
+        "associate": 2,
+        "bachelor": 3,
+        "master": 4,
+        "phd": 5,
+        "doctorate": 5
+    }
+    _EDU_RE = re.compile("|".join(map(re.escape, EDU_LEVELS)))
+    
     def __init__(self):
         self.text_cleaner = TextCleaner()
+        self._init_caches()
+    
+    def _init_caches(self):
+        """Wrap per-text work in per-instance LRU caches."""
+        # predict_batch cleans the same resume once per job; clean it once
+        self._clean_text = lru_cache(maxsize=self.CLEAN_CACHE_MAX_ENTRIES)(
+            self.text_cleaner.clean_text
+        )
+        # Likewise its token set, which is only ever read
+        self._token_set = lru_cache(maxsize=self.CLEAN_CACHE_MAX_ENTRIES)(
+            FeatureEngineer._token_set
+        )
+    
+    def __getstate__(self):
+        # lru_cache wrappers don't pickle; worker processes rebuild them
+        return {"text_cleaner": self.text_cleaner}
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_caches()
     
     def extract_features(
         self,
@@ -67,6 +152,112 @@ class FeatureEngineer:
         
         return features
     
+    def extract_features_batch(
+        self,
+        resume_data: Dict[str, Any],
+        jobs: List[Dict[str, Any]]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Extract features for one resume against many jobs, column-wise.
+        
+        Resume-side work (skill set, cleaned text, education level) is
+        done once, and each feature is a NumPy column over all jobs
+        instead of one dict per pair.
+        
+        Args:
+            resume_data: Resume information
+            jobs: List of job dictionaries
+            
+        Returns:
+            Feature columns keyed by name, each of length len(jobs);
+            row i equals extract_features(resume_data, jobs[i])
+        """
+        n = len(jobs)
+        
+        # Skill features
+        resume_skills = set(s.lower() for s in resume_data.get("skills", []))
+        job_skill_sets = [
+            set(s.lower() for s in job.get("skills_required", [])) for job in jobs
+        ]
+        job_skill_counts = np.fromiter(map(len, job_skill_sets), dtype=np.int64, count=n)
+        overlap = np.fromiter(
+            (len(resume_skills.intersection(s)) for s in job_skill_sets),
+            dtype=np.int64, count=n
+        )
+        no_job_skills = job_skill_counts == 0
+        
+        # Experience features
+        resume_exp = resume_data.get("experience_years", 0)
+        job_exp = np.asarray([job.get("experience_required", 0) for job in jobs])
+        no_job_exp = job_exp == 0
+        
+        # Text features
+        resume_text = resume_data.get("raw_text", "")
+        job_texts = [job.get("description", "") for job in jobs]
+        resume_tokens = self._token_set(self._clean_text(resume_text))
+        job_token_sets = [self._token_set(self._clean_text(text)) for text in job_texts]
+        job_token_counts = np.fromiter(map(len, job_token_sets), dtype=np.int64, count=n)
+        common = np.fromiter(
+            (self._common_token_count(resume_tokens, t) for t in job_token_sets),
+            dtype=np.int64, count=n
+        )
+        union = len(resume_tokens) + job_token_counts - common
+        
+        # Education features
+        degrees = "\n".join(
+            str(edu.get("degree", "")) for edu in resume_data.get("education", [])
+        )
+        candidate_level = max(
+            (self.EDU_LEVELS[key] for key in self._EDU_RE.findall(degrees.lower())),
+            default=0
+        )
+        required_level = np.fromiter(
+            (
+                min(
+                    (self.EDU_LEVELS[key] for key in self._EDU_RE.findall(
+                        job.get("education_required", "").lower()
+                    )),
+                    default=0
+                )
+                for job in jobs
+            ),
+            dtype=np.int64, count=n
+        )
+        no_required_level = required_level == 0
+        
+        return {
+            "skill_overlap_ratio": np.where(
+                no_job_skills, 1.0, overlap / np.maximum(job_skill_counts, 1)
+            ),
+            "skill_overlap_count": np.where(no_job_skills, len(resume_skills), overlap),
+            "skill_gap_count": job_skill_counts - overlap,
+            "extra_skills_count": len(resume_skills) - overlap,
+            "experience_ratio": np.where(
+                no_job_exp, 1.0,
+                np.minimum(1.0, resume_exp / np.where(no_job_exp, 1, job_exp))
+            ),
+            "experience_diff": resume_exp - job_exp,
+            "experience_meets_req": (resume_exp >= job_exp).astype(np.float64),
+            "experience_exceeds": (resume_exp > job_exp).astype(np.float64),
+            "text_jaccard_similarity": np.where(
+                job_token_counts == 0, 0.5, common / np.maximum(union, 1)
+            ),
+            "resume_length": np.full(n, len(resume_text.split())),
+            "job_length": np.fromiter(
+                (len(text.split()) for text in job_texts), dtype=np.int64, count=n
+            ),
+            "common_tokens_count": common,
+            "education_level_ratio": np.where(
+                no_required_level, 1.0,
+                np.minimum(1.0, candidate_level / np.maximum(required_level, 1))
+            ),
+            "education_meets_req": np.where(
+                no_required_level, 1.0, (candidate_level >= required_level).astype(np.float64)
+            ),
+            "candidate_education_level": np.full(n, candidate_level),
+            "required_education_level": required_level
+        }
+    
     def _extract_skill_features(
         self,
         resume_skills: List[str],
@@ -122,58 +313,60 @@ class FeatureEngineer:
     ) -> Dict[str, float]:
         """Extract text-based features."""
         # Clean texts
-        resume_clean = self.text_cleaner.clean_text(resume_text)
-        job_clean = self.text_cleaner.clean_text(job_text)
+        resume_clean = self._clean_text(resume_text)
+        job_clean = self._clean_text(job_text)
         
-        # Token overlap
-        resume_tokens = set(resume_clean.split())
-        job_tokens = set(job_clean.split())
+        # Token overlap; |A u B| = |A| + |B| - |A n B|, so no union is built
+        resume_tokens = self._token_set(resume_clean)
+        job_tokens = self._token_set(job_clean)
+        common = self._common_token_count(resume_tokens, job_tokens)
         
-        if not job_tokens:
+        if not len(job_tokens):
             jaccard = 0.5
         else:
-            intersection = resume_tokens.intersection(job_tokens)
-            union = resume_tokens.union(job_tokens)
-            jaccard = len(intersection) / len(union) if union else 0
+            jaccard = common / (len(resume_tokens) + len(job_tokens) - common)
         
         return {
             "text_jaccard_similarity": jaccard,
             "resume_length": len(resume_text.split()),
             "job_length": len(job_text.split()),
-            "common_tokens_count": len(resume_tokens.intersection(job_tokens))
+            "common_tokens_count": common
         }
     
+    @staticmethod
+    def _token_set(clean_text: str):
+        """Unique tokens of cleaned text: sorted hashes with numba, else a set."""
+        if NUMBA_AVAILABLE:
+            hashes = _token_hashes(clean_text)
+            hashes.flags.writeable = False
+            return hashes
+        return frozenset(clean_text.split())
+    
+    @staticmethod
+    def _common_token_count(a, b) -> int:
+        """Size of the intersection of two _token_set results."""
+        if NUMBA_AVAILABLE:
+            return _sorted_intersection_count(a, b)
+        return len(a.intersection(b))
+    
     def _extract_education_features(
         self,
         resume_education: List[Dict],
         job_education: str
     ) -> Dict[str, float]:
         """Extract education-based features."""
-        # Education level mapping
-        edu_levels = {
-            "high school": 1,
-            "associate": 2,
-            "bachelor": 3,
-            "master": 4,
-            "phd": 5,
-            "doctorate": 5
-        }
+        # Get required level: the lowest level mentioned
+        required_level = min(
+            (self.EDU_LEVELS[key] for key in self._EDU_RE.findall(job_education.lower())),
+            default=0
+        )
         
-        # Get required level
-        required_level = 0
-        job_edu_lower = job_education.lower()
-        for key, level in edu_levels.items():
-            if key in job_edu_lower:
-                required_level = level
-                break
-        
-        # Get candidate's highest level
-        candidate_level = 0
-        for edu in resume_education:
-            degree = str(edu.get("degree", "")).lower()
-            for key, level in edu_levels.items():
-                if key in degree:
-                    candidate_level = max(candidate_level, level)
+        # Get candidate's highest level across all degrees in one scan
+        degrees = "\n".join(str(edu.get("degree", "")) for edu in resume_education)
+        candidate_level = max(
+            (self.EDU_LEVELS[key] for key in self._EDU_RE.findall(degrees.lower())),
+            default=0
+        )
         
         if required_level == 0:
             edu_ratio = 1.0
@@ -189,48 +382,31 @@ class FeatureEngineer:
             "required_education_level": required_level
         }
     
-    def features_to_vector(self, features: Dict[str, float]) -> np.ndarray:
-        """Convert feature dictionary to numpy array."""
-        # Define consistent feature order
-        feature_order = [
-            "skill_overlap_ratio",
-            "skill_overlap_count",
-            "skill_gap_count",
-            "extra_skills_count",
-            "experience_ratio",
-            "experience_diff",
-            "experience_meets_req",
-            "experience_exceeds",
-            "text_jaccard_similarity",
-            "resume_length",
-            "job_length",
-            "common_tokens_count",
-            "education_level_ratio",
-            "education_meets_req",
-            "candidate_education_level",
-            "required_education_level"
-        ]
+    def features_to_vector(
+        self,
+        features: Dict[str, float],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Convert feature dictionary to numpy array.
         
-        return np.array([features.get(f, 0.0) for f in feature_order])
+        Args:
+            features: Feature values keyed by name
+            out: Optional preallocated array (e.g. a row of a feature
+                matrix) to fill in place instead of allocating
+            
+        Returns:
+            Feature vector in FEATURE_NAMES order
+        """
+        values = map(features.get, self.FEATURE_NAMES, repeat(0.0))
+        if out is None:
+            return np.fromiter(values, dtype=np.float64, count=len(self.FEATURE_NAMES))
+        
+        for i, value in enumerate(values):
+            out[i] = value
+        return out
     
     @property
     def feature_names(self) -> List[str]:
         """Get ordered list of feature names."""
-        return [
-            "skill_overlap_ratio",
-            "skill_overlap_count",
-            "skill_gap_count",
-            "extra_skills_count",
-            "experience_ratio",
-            "experience_diff",
-            "experience_meets_req",
-            "experience_exceeds",
-            "text_jaccard_similarity",
-            "resume_length",
-            "job_length",
-            "common_tokens_count",
-            "education_level_ratio",
-            "education_meets_req",
-            "candidate_education_level",
-            "required_education_level"
-        ]
+        return list(self.FEATURE_NAMES)
@@ -7,6 +7,7 @@ Text preprocessing utilities for NLP pipeline.
 
 import re
 import string
+from functools import lru_cache
 from typing import List, Optional
 
 # Try to import NLP libraries
@@ -36,16 +37,63 @@ try:
 except ImportError:
     NLTK_AVAILABLE = False
 
+# Patterns used by clean_text, compiled once. They run as separate subs:
+# one alternation needs a Python callback per match to pick the replacement,
+# which is slower than several C-level passes, and reorders URL/email removal
+_URL_RE = re.compile(r'http\S+|www\.\S+')
+_EMAIL_RE = re.compile(r'\S+@\S+')
+_NUM_RE = re.compile(r'\d+')
+_PUNCT_RE = re.compile(r'[^\w\s\-\+\#]')
+_TOKEN_RE = re.compile(r'\w[\w\-\+\#]*')
+
+
+class _LemmaCache(dict):
+    """
+    Surface form -> lemma map, filled on first lookup.
+    
+    Resumes and jobs repeat most of their vocabulary, so after warm-up each
+    token position is a plain dict subscript instead of a WordNet _morphy
+    call (or an lru_cache wrapper call).
+    """
+    
+    MAX_ENTRIES = 50_000
+    
+    def __init__(self, lemmatizer):
+        super().__init__()
+        self.lemmatizer = lemmatizer
+    
+    def __missing__(self, token: str) -> str:
+        lemma = self.lemmatizer.lemmatize(token)
+        if len(self) < self.MAX_ENTRIES:
+            self[token] = lemma
+        return lemma
+
+
+@lru_cache(maxsize=32)
+def _special_chars_re(keep_chars: str) -> re.Pattern:
+    """Compiled pattern for remove_special_characters, per keep_chars."""
+    return re.compile(f'[^a-zA-Z0-9\\s{re.escape(keep_chars)}]')
+
 
 class TextCleaner:
     """
     Text preprocessing utilities for cleaning and normalizing text.
     """
     
-    def __init__(self):
+    def __init__(self, use_punkt: bool = False):
+        """
+        Initialize cleaner.
+        
+        Args:
+            use_punkt: Tokenize with NLTK's word_tokenize instead of the
+                precompiled regex tokenizer (word_tokenize is always used
+                when punctuation is kept)
+        """
+        self.use_punkt = use_punkt
         if NLTK_AVAILABLE:
             self.stop_words = set(stopwords.words('english'))
             self.lemmatizer = WordNetLemmatizer()
+            self._lemmas = _LemmaCache(self.lemmatizer)
         else:
             # Basic stop words fallback
             self.stop_words = {
@@ -98,48 +146,56 @@ class TextCleaner:
         if lowercase:
             text = text.lower()
         
-        # Remove URLs
-        text = re.sub(r'http\S+|www\.\S+', '', text)
+        # Remove URLs and email addresses; the substring checks skip the
+        # regex scans (\S+@ backtracks across every word) when they can't match
+        if 'http' in text or 'www.' in text:
+            text = _URL_RE.sub('', text)
         
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
+        if '@' in text:
+            text = _EMAIL_RE.sub('', text)
         
         # Remove numbers
         if remove_numbers:
-            text = re.sub(r'\d+', '', text)
+            text = _NUM_RE.sub('', text)
         
         # Remove punctuation
         if remove_punctuation:
             # Keep some punctuation that might be meaningful
-            text = re.sub(r'[^\w\s\-\+\#]', ' ', text)
+            text = _PUNCT_RE.sub(' ', text)
         
         # Tokenize
-        tokens = self._tokenize(text)
-        
-        # Remove stopwords
-        if remove_stopwords:
-            tokens = [t for t in tokens if t not in self.stop_words]
+        tokens = self._tokenize(text, punctuation_removed=remove_punctuation)
         
-        # Lemmatize
+        # Remove stopwords and lemmatize in a single pass
+        stop_words = self.stop_words if remove_stopwords else ()
         if lemmatize and self.lemmatizer:
-            tokens = [self.lemmatizer.lemmatize(t) for t in tokens]
-        
-        # Remove extra whitespace
-        text = ' '.join(tokens)
-        text = re.sub(r'\s+', ' ', text).strip()
+            lemmas = self._lemmas
+            tokens = [lemmas[t] for t in tokens if t not in stop_words]
+        elif remove_stopwords:
+            tokens = [t for t in tokens if t not in stop_words]
         
-        return text
+        # Tokens never contain whitespace, so joining normalizes it
+        return ' '.join(tokens)
     
-    def _tokenize(self, text: str) -> List[str]:
-        """Tokenize text into words."""
+    def _tokenize(self, text: str, punctuation_removed: bool = True) -> List[str]:
+        """
+        Tokenize text into words.
+        
+        The regex tokenizer drops punctuation tokens, so it only runs on
+        text that has already been stripped of punctuation.
+        """
+        if punctuation_removed and not self.use_punkt:
+            # Words, keeping inner -, + and # (c++, c#, scikit-learn)
+            return _TOKEN_RE.findall(text)
+        
         if NLTK_AVAILABLE:
             try:
                 return word_tokenize(text)
             except:
                 pass
         
-        # Fallback to simple split
-        return text.split()
+        # Fallback to simple split, which keeps punctuation attached
+        return _TOKEN_RE.findall(text) if punctuation_removed else text.split()
     
     def extract_sentences(self, text: str) -> List[str]:
         """Extract sentences from text."""
@@ -160,14 +216,39 @@ class TextCleaner:
     
     def remove_special_characters(self, text: str, keep_chars: str = "") -> str:
         """Remove special characters from text."""
-        pattern = f'[^a-zA-Z0-9\\s{re.escape(keep_chars)}]'
-        return re.sub(pattern, '', text)
+        return _special_chars_re(keep_chars).sub('', text)
 
 
-def clean_resume_text(text: str) -> str:
-    """Convenience function for cleaning resume text."""
-    cleaner = TextCleaner()
-    return cleaner.clean_text(
+@lru_cache(maxsize=1)
+def _get_default_cleaner() -> TextCleaner:
+    """Shared cleaner, so stopwords and the lemmatizer load once."""
+    return TextCleaner()
+
+
+@lru_cache(maxsize=2048)
+def clean_text_cached(text: str, **options) -> str:
+    """
+    Clean text with the shared cleaner, memoized per (text, options).
+    
+    Args:
+        text: Input text
+        **options: Keyword options for TextCleaner.clean_text
+        
+    Returns:
+        Cleaned text
+    """
+    return _get_default_cleaner().clean_text(text, **options)
+
+
+@lru_cache(maxsize=2048)
+def _clean_for_matching(text: str) -> str:
+    """
+    clean_text with the flags fixed for resume/job matching.
+    
+    Resume and job text share this cache, and its key is the text alone, so
+    a hit skips hashing five keyword options.
+    """
+    return _get_default_cleaner().clean_text(
         text,
         lowercase=True,
         remove_punctuation=True,
@@ -177,14 +258,11 @@ def clean_resume_text(text: str) -> str:
     )
 
 
+def clean_resume_text(text: str) -> str:
+    """Convenience function for cleaning resume text."""
+    return _clean_for_matching(text)
+
+
 def clean_job_description(text: str) -> str:
     """Convenience function for cleaning job descriptions."""
-    cleaner = TextCleaner()
-    return cleaner.clean_text(
-        text,
-        lowercase=True,
-        remove_punctuation=True,
-        remove_numbers=False,
-        remove_stopwords=True,
-        lemmatize=True
-    )
+    return _clean_for_matching(text)
@@ -4,7 +4,6 @@ Deletes the database and recreates ALL tables from scratch using SQLAlchemy.
 """
 
 import asyncio
-import json
 from pathlib import Path
 import sys
 import os
@@ -19,6 +18,7 @@ if db_path.exists():
     print(f"Deleted old database: {db_path}")
 
 from database.connection import engine, Base
+from database.seed import insert_seed_jobs
 from models import User, Resume, Job, Match, Recommendation
 
 
@@ -37,36 +37,10 @@ async def reset_database():
     seed_file = Path(__file__).parent / "data" / "raw" / "seed_jobs.json"
     
     if seed_file.exists():
-        with open(seed_file, "r") as f:
-            jobs_data = json.load(f)
-        
-        print(f"Loaded {len(jobs_data)} jobs from seed file")
-        
-        from database.connection import async_session_maker
-        
-        async with async_session_maker() as session:
-            for job_data in jobs_data:
-                job = Job(
-                    title=job_data["title"],
-                    company=job_data["company"],
-                    description=job_data.get("description", "No description"),
-                    requirements=job_data.get("requirements"),
-                    skills_required=job_data.get("skills_required", []),
-                    experience_required=job_data.get("experience_required"),
-                    education_required=job_data.get("education_required"),
-                    location=job_data.get("location"),
-                    job_type=job_data.get("job_type"),
-                    remote_option=job_data.get("remote_option"),
-                    salary_min=job_data.get("salary_min"),
-                    salary_max=job_data.get("salary_max"),
-                    salary_currency="USD",
-                    apply_url=job_data.get("apply_url"),
-                    is_active=1
-                )
-                session.add(job)
-            
-            await session.commit()
-            print(f"Inserted {len(jobs_data)} jobs")
+        # Stream rows into executemany batches inside one transaction
+        async with engine.begin() as conn:
+            inserted = await insert_seed_jobs(conn, seed_file, "No description")
+        print(f"Inserted {inserted} jobs")
     
     await engine.dispose()
     print("✅ Database reset complete!")
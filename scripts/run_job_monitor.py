@@ -79,32 +79,29 @@ async def run_once():
     return result
 
 
-async def run_scheduled():
-    """Run the job monitor on a schedule."""
-    import schedule
-    import time
+async def run_scheduled(interval_minutes: int = 30):
+    """
+    Run the job monitor on a schedule.
     
+    Every run shares this event loop, so the database engine and its
+    connections stay warm between runs.
+    
+    Args:
+        interval_minutes: Minutes to wait between runs
+    """
     print("\n" + "=" * 60)
     print("🔄 TalentLens AI - Job Monitor (Scheduled Mode)")
     print("=" * 60)
-    print("Running every 30 minutes. Press Ctrl+C to stop.")
+    print(f"Running every {interval_minutes} minutes. Press Ctrl+C to stop.")
     print("-" * 60 + "\n")
     
-    # Run immediately first
-    await run_once()
-    
-    # Schedule future runs
-    def sync_run():
-        asyncio.run(run_once())
-    
-    schedule.every(30).minutes.do(sync_run)
-    
-    try:
-        while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
-    except KeyboardInterrupt:
-        print("\n\n👋 Job monitor stopped by user.")
+    # Run immediately first, then after every interval
+    while True:
+        try:
+            await run_once()
+        except Exception:
+            logger.exception("Scheduled job monitor run failed")
+        await asyncio.sleep(interval_minutes * 60)
 
 
 async def test_notifications():
@@ -152,7 +149,10 @@ def main():
     if args.test:
         asyncio.run(test_notifications())
     elif args.schedule:
-        asyncio.run(run_scheduled())
+        try:
+            asyncio.run(run_scheduled())
+        except KeyboardInterrupt:
+            print("\n\n👋 Job monitor stopped by user.")
     else:
         asyncio.run(run_once())
 
@@ -7,16 +7,16 @@ This ensures the schema ALWAYS matches the application models.
 """
 
 import asyncio
-import json
 from pathlib import Path
 import sys
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 
-from database.connection import engine, Base, async_session_maker
+from database.connection import engine, Base
+from database.seed import insert_seed_jobs
 from models import Job
-from sqlalchemy import delete
+from sqlalchemy import delete, text
 
 
 async def seed_jobs():
@@ -29,11 +29,6 @@ async def seed_jobs():
         print(f"Seed file not found: {seed_file}")
         return
     
-    with open(seed_file, "r") as f:
-        jobs_data = json.load(f)
-    
-    print(f"Loaded {len(jobs_data)} jobs from seed file")
-    
     # Create all tables using SQLAlchemy models (this ensures correct schema)
     async with engine.begin() as conn:
         # This creates tables if they don't exist, with the CORRECT schema
@@ -41,40 +36,31 @@ async def seed_jobs():
     
     print("Database tables verified/created with correct schema")
     
-    # Clear existing jobs and insert new ones
-    async with async_session_maker() as session:
-        # Delete all existing jobs
-        await session.execute(delete(Job))
-        await session.commit()
+    # Clear existing jobs and insert new ones in one transaction
+    async with engine.begin() as conn:
+        # Delete all existing jobs. PostgreSQL truncates without scanning
+        # rows and restarts the id sequence; SQLite already turns an
+        # unconditional DELETE into a table truncate
+        if conn.dialect.name == "postgresql":
+            await conn.execute(text(f"TRUNCATE TABLE {Job.__tablename__} RESTART IDENTITY CASCADE"))
+        else:
+            await conn.execute(delete(Job))
         print("Cleared existing jobs")
         
-        # Insert new jobs using the SQLAlchemy model
-        for job_data in jobs_data:
-            job = Job(
-                title=job_data["title"],
-                company=job_data["company"],
-                description=job_data.get("description", ""),
-                requirements=job_data.get("requirements"),
-                skills_required=job_data.get("skills_required", []),
-                experience_required=job_data.get("experience_required"),
-                education_required=job_data.get("education_required"),
-                location=job_data.get("location"),
-                job_type=job_data.get("job_type"),
-                remote_option=job_data.get("remote_option"),
-                salary_min=job_data.get("salary_min"),
-                salary_max=job_data.get("salary_max"),
-                salary_currency="USD",
-                apply_url=job_data.get("apply_url"),
-                is_active=1
-            )
-            session.add(job)
-        
-        await session.commit()
-        print(f"Inserted {len(jobs_data)} jobs into database")
+        # Stream new jobs into executemany batches against the model's table
+        inserted = await insert_seed_jobs(conn, seed_file)
+        print(f"Inserted {inserted} jobs into database")
     
-    await engine.dispose()
     print("✅ Database seeding complete!")
 
 
+async def main():
+    """Seed, then close the pool once the process is done with it."""
+    try:
+        await seed_jobs()
+    finally:
+        await engine.dispose()
+
+
 if __name__ == "__main__":
-    asyncio.run(seed_jobs())
+    asyncio.run(main())
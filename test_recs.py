@@ -9,6 +9,10 @@ from database.connection import async_session_maker
 from models import Resume, Job
 from services.recommendation_service import RecommendationService
 from sqlalchemy import select
+from sqlalchemy.orm import defer
+
+# Built once; recommendations never read the embedding blob, so skip loading it
+ACTIVE_JOBS = select(Job).where(Job.is_active == 1).options(defer(Job.embedding))
 
 async def test():
     print("Starting recommendation test...")
@@ -24,7 +28,7 @@ async def test():
         print(f"Skills: {resume.skills}")
 
         # Get jobs
-        jobs_result = await db.execute(select(Job).where(Job.is_active == 1))
+        jobs_result = await db.execute(ACTIVE_JOBS)
         jobs = jobs_result.scalars().all()
         print(f"Found {len(jobs)} active jobs")
         
@@ -0,0 +1,30 @@
+"""
+Shared test setup: a throwaway SQLite database and the backend on sys.path.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# Must be set before core.config reads the environment
+_db_dir = tempfile.mkdtemp(prefix="talentlens-tests-")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_dir}/test.db"
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from database.connection import engine, Base  # noqa: E402
+
+
+@pytest.fixture
+async def db_engine():
+    """Fresh tables for each test; the pool is dropped so no loop is reused."""
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
@@ -0,0 +1,42 @@
+"""
+Run the database smoke-test scripts together.
+
+test_gen.py, test_recs.py and test_user.py only read from the database,
+so they run concurrently in one event loop, sharing one interpreter
+start-up and the engine's connection pool. Their output may interleave.
+
+Usage:
+    python tests/run_all.py
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# The scripts live in the project root and add backend/ to the path themselves
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from test_gen import test as test_gen
+from test_recs import test as test_recs
+from test_user import test as test_user
+from database.connection import engine
+
+
+async def main():
+    names = ("test_gen", "test_recs", "test_user")
+    results = await asyncio.gather(
+        test_gen(), test_recs(), test_user(),
+        return_exceptions=True
+    )
+    await engine.dispose()
+
+    failed = False
+    for name, result in zip(names, results):
+        if isinstance(result, Exception):
+            failed = True
+            print(f"❌ {name} failed: {result!r}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,93 @@
+"""
+Deduplication of job listings on ix_jobs_dedupe (title, company, apply_url).
+"""
+
+import pytest
+from sqlalchemy import func, select, text
+
+from models import Job
+from tasks.job_monitor import JobMonitor
+
+
+def _scraped_job(title="ML Engineer", company="Acme", url="https://acme.test/jobs/1"):
+    return {
+        "title": title,
+        "company": company,
+        "apply_url": url,
+        "description": "Build models",
+        "source": "test",
+    }
+
+
+async def _job_count(engine) -> int:
+    async with engine.connect() as conn:
+        return (await conn.execute(select(func.count()).select_from(Job))).scalar_one()
+
+
+async def test_monitor_skips_jobs_already_stored(db_engine):
+    monitor = JobMonitor()
+    
+    assert await monitor._store_jobs_in_db([_scraped_job(), _scraped_job(url="https://acme.test/jobs/2")]) == 2
+    assert await monitor._store_jobs_in_db([_scraped_job(), _scraped_job(title="Data Engineer")]) == 1
+    assert await _job_count(db_engine) == 3
+
+
+async def test_monitor_filters_by_lookup_without_unique_index(db_engine):
+    # A legacy table that already holds duplicates cannot get the index
+    async with db_engine.begin() as conn:
+        await conn.execute(text("DROP INDEX ix_jobs_dedupe"))
+        for _ in range(2):
+            await conn.execute(Job.__table__.insert().values(
+                title="ML Engineer", company="Acme",
+                apply_url="https://acme.test/jobs/1", description=""
+            ))
+    
+    monitor = JobMonitor()
+    stored = await monitor._store_jobs_in_db([_scraped_job(), _scraped_job(title="Data Engineer")])
+    
+    assert monitor._dedupe_index_ready is False
+    assert stored == 1
+    assert await _job_count(db_engine) == 3
+
+
+@pytest.fixture
+async def api_client(db_engine, tmp_path, monkeypatch):
+    httpx = pytest.importorskip("httpx")
+    pytest.importorskip("multipart")
+    # main adds a file log sink relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    from main import app
+    from core.security import get_current_user
+    
+    app.dependency_overrides[get_current_user] = lambda: "1"
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    app.dependency_overrides.clear()
+
+
+JOB_PAYLOAD = {
+    "title": "Backend Developer",
+    "company": "Acme",
+    "description": "APIs",
+    "apply_url": "https://acme.test/jobs/9",
+}
+
+
+async def test_post_duplicate_job_returns_conflict(api_client):
+    first = await api_client.post("/api/jobs/", json=JOB_PAYLOAD)
+    second = await api_client.post("/api/jobs/", json=JOB_PAYLOAD)
+    
+    assert first.status_code == 201
+    assert second.status_code == 409
+
+
+async def test_update_into_duplicate_job_returns_conflict(api_client):
+    await api_client.post("/api/jobs/", json=JOB_PAYLOAD)
+    other = await api_client.post("/api/jobs/", json={**JOB_PAYLOAD, "apply_url": "https://acme.test/jobs/10"})
+    
+    response = await api_client.put(
+        f"/api/jobs/{other.json()['id']}", json={"apply_url": JOB_PAYLOAD["apply_url"]}
+    )
+    
+    assert response.status_code == 409
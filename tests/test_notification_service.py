@@ -0,0 +1,57 @@
+"""
+Repeat-alert suppression in NotificationService.send_job_alert.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from services.notification_service import NotificationService
+
+
+JOBS = [
+    {"title": "ML Engineer", "company": "Acme", "apply_url": "https://acme.test/1", "source": "test"},
+    {"title": "Data Engineer", "company": "Acme", "apply_url": "https://acme.test/2", "source": "test"},
+]
+
+
+@pytest.fixture
+def notifier(monkeypatch):
+    monkeypatch.setattr(NotificationService, "_recent_alerts", OrderedDict())
+    return NotificationService()
+
+
+def _set_delivery(monkeypatch, notifier, delivered: bool):
+    monkeypatch.setattr(notifier, "send_desktop_notification", lambda title, message: delivered)
+    monkeypatch.setattr(notifier, "send_email_notification", lambda subject, body: delivered)
+
+
+def test_delivered_alerts_are_suppressed_on_repeat(monkeypatch, notifier):
+    _set_delivery(monkeypatch, notifier, True)
+    
+    first = notifier.send_job_alert(JOBS)
+    second = notifier.send_job_alert(JOBS)
+    
+    assert first["jobs_count"] == 2
+    assert second["jobs_count"] == 0
+    assert second["duplicates_skipped"] == 2
+
+
+def test_failed_alerts_are_retried(monkeypatch, notifier):
+    _set_delivery(monkeypatch, notifier, False)
+    notifier.send_job_alert(JOBS)
+    
+    _set_delivery(monkeypatch, notifier, True)
+    retry = notifier.send_job_alert(JOBS)
+    
+    assert retry["jobs_count"] == 2
+    assert retry["email_sent"]
+
+
+def test_repeats_within_one_batch_are_dropped(monkeypatch, notifier):
+    _set_delivery(monkeypatch, notifier, True)
+    
+    result = notifier.send_job_alert(JOBS + JOBS[:1])
+    
+    assert result["jobs_count"] == 2
+    assert result["duplicates_skipped"] == 1
@@ -0,0 +1,38 @@
+"""
+How MatchPredictor decides whether a saved model expects scaled features.
+"""
+
+import json
+
+import pytest
+
+MatchPredictor = pytest.importorskip("ml.inference.predictor").MatchPredictor
+
+
+@pytest.fixture
+def model_dir(tmp_path):
+    # Layout written by ModelTrainer.save_models(prefix="v1_")
+    (tmp_path / "v1_best_model_info.json").write_text(json.dumps({
+        "best_model": "gradient_boosting",
+        "scaled_input": False,
+        "scaled_models": ["logistic_regression"],
+        "timestamp": "20260101_000000"
+    }))
+    return tmp_path
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("gradient_boosting", False),
+    ("random_forest", False),
+    ("logistic_regression", True),
+])
+def test_scaled_input_read_from_best_model_info(model_dir, name, expected):
+    model_path = model_dir / f"v1_{name}_20260101_000000.joblib"
+    
+    assert MatchPredictor._saved_scaled_input(str(model_path)) is expected
+
+
+def test_model_from_another_run_is_not_described(model_dir):
+    model_path = model_dir / "v1_gradient_boosting_20250101_000000.joblib"
+    
+    assert MatchPredictor._saved_scaled_input(str(model_path)) is None
@@ -0,0 +1,35 @@
+"""Regression tests for skill gap analysis."""
+
+from types import SimpleNamespace
+
+from services.recommendation_service import RecommendationService
+
+
+async def test_skill_gap_analysis_ranks_missing_skills_by_frequency():
+    service = RecommendationService()
+    resume = SimpleNamespace(skills=["Python"])
+    jobs = [
+        SimpleNamespace(skills_required=["Python", "Docker", "AWS"]),
+        SimpleNamespace(skills_required=["docker", "Kubernetes"]),
+        SimpleNamespace(skills_required=["Docker", "aws"]),
+    ]
+
+    analysis = await service.generate_skill_gap_analysis(resume, jobs)
+
+    assert analysis["critical_gaps"] == ["docker"]
+    assert analysis["important_gaps"] == ["aws", "kubernetes"]
+    assert analysis["nice_to_have"] == []
+    assert analysis["overall_coverage"] == 25.0
+
+
+async def test_skill_gap_analysis_keeps_no_vocabulary_between_calls():
+    service = RecommendationService()
+    resume = SimpleNamespace(skills=[])
+
+    for batch in range(3):
+        jobs = [SimpleNamespace(skills_required=[f"skill-{batch}-{i}" for i in range(50)])]
+        analysis = await service.generate_skill_gap_analysis(resume, jobs)
+        assert analysis["critical_gaps"] == [f"skill-{batch}-{i}" for i in range(5)]
+
+    assert not hasattr(RecommendationService, "_skill_bits")
+    assert not hasattr(RecommendationService, "_skill_names")
@@ -0,0 +1,62 @@
+"""
+DOCX text streaming in ResumeParserService, checked against python-docx.
+"""
+
+import io
+import zipfile
+
+import pytest
+
+docx = pytest.importorskip("docx")
+pytest.importorskip("lxml")
+
+from services.resume_parser import ResumeParserService
+
+
+@pytest.fixture
+def parser():
+    return ResumeParserService()
+
+
+def _docx_bytes(document) -> bytes:
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def test_stream_keeps_tabs_and_line_breaks_between_runs(parser):
+    document = docx.Document()
+    title = document.add_paragraph().add_run("Software Engineer")
+    title.add_break()
+    skills = document.add_paragraph()
+    skills.add_run("Python")
+    skills.add_run().add_tab()
+    skills.add_run("Java")
+    skills.add_run().add_break()
+    skills.add_run("Docker Kubernetes")
+    content = _docx_bytes(document)
+
+    streamed = parser._clean_text(parser._stream_docx_text(content))
+
+    assert streamed == "Software Engineer Python Java Docker Kubernetes"
+    assert streamed == parser._clean_text(parser._read_docx_text(content))
+
+
+def test_stream_skips_alternate_content_fallback(parser):
+    w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+    mc = "http://schemas.openxmlformats.org/markup-compatibility/2006"
+    document_xml = f"""<?xml version="1.0" encoding="UTF-8" standalone="yes"?>
+<w:document xmlns:w="{w}" xmlns:mc="{mc}"><w:body>
+<w:p><w:r><w:t>Skills</w:t></w:r></w:p>
+<w:p><w:r><mc:AlternateContent>
+<mc:Choice Requires="wps"><w:txbxContent><w:p><w:r><w:t>Docker</w:t></w:r></w:p></w:txbxContent></mc:Choice>
+<mc:Fallback><w:txbxContent><w:p><w:r><w:t>Docker</w:t></w:r></w:p></w:txbxContent></mc:Fallback>
+</mc:AlternateContent></w:r></w:p>
+</w:body></w:document>"""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        archive.writestr("word/document.xml", document_xml)
+
+    streamed = parser._clean_text(parser._stream_docx_text(buffer.getvalue()))
+
+    assert streamed == "Skills Docker"
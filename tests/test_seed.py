@@ -0,0 +1,30 @@
+"""
+Batched seed job loading shared by the database scripts.
+"""
+
+import json
+
+from sqlalchemy import select
+
+from database import seed
+from models import Job
+
+
+async def test_insert_seed_jobs_streams_every_batch(db_engine, tmp_path, monkeypatch):
+    monkeypatch.setattr(seed, "SEED_INSERT_BATCH", 2)
+    seed_file = tmp_path / "seed_jobs.json"
+    seed_file.write_text(json.dumps([
+        {"title": f"Engineer {i}", "company": "Acme", "skills_required": ["python"],
+         "apply_url": f"https://acme.test/jobs/{i}"}
+        for i in range(5)
+    ]))
+    
+    async with db_engine.begin() as conn:
+        inserted = await seed.insert_seed_jobs(conn, seed_file, "No description")
+    
+    async with db_engine.connect() as conn:
+        rows = (await conn.execute(select(Job.title, Job.description, Job.skills_required))).all()
+    
+    assert inserted == 5
+    assert sorted(title for title, _, _ in rows) == [f"Engineer {i}" for i in range(5)]
+    assert {(description, tuple(skills)) for _, description, skills in rows} == {("No description", ("python",))}
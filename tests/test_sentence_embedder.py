@@ -0,0 +1,38 @@
+"""
+SentenceEmbedder.batch_similarity scoring against float corpora.
+"""
+
+import numpy as np
+import pytest
+
+SentenceEmbedder = pytest.importorskip("ml.embeddings.sentence_embedder").SentenceEmbedder
+
+
+@pytest.fixture
+def embedder():
+    # batch_similarity needs no model, so skip loading one
+    return SentenceEmbedder.__new__(SentenceEmbedder)
+
+
+def test_batch_similarity_sees_in_place_corpus_updates(embedder):
+    query = np.array([1.0, 0.0], dtype=np.float32)
+    corpus = np.array([[1.0, 0.0], [0.0, 1.0]], dtype=np.float32)
+    assert embedder.batch_similarity(query, corpus)[0] == pytest.approx(1.0)
+
+    corpus[0] = [0.0, 1.0]
+
+    assert embedder.batch_similarity(query, corpus)[0] == pytest.approx(0.5)
+
+
+def test_batch_similarity_accepts_pre_normalized_corpus(embedder):
+    rng = np.random.default_rng(0)
+    query = rng.normal(size=8).astype(np.float32)
+    corpus = rng.normal(size=(5, 8)).astype(np.float32)
+
+    unit = SentenceEmbedder.normalize_corpus(corpus)
+
+    np.testing.assert_allclose(
+        embedder.batch_similarity(query, unit, normalized=True),
+        embedder.batch_similarity(query, corpus),
+        rtol=1e-6
+    )
@@ -0,0 +1,66 @@
+"""
+Keyword skill matching in SkillExtractorService.
+"""
+
+import pytest
+
+from services import skill_extractor
+from services.skill_extractor import SkillExtractorService
+
+
+@pytest.fixture(params=[True, False], ids=["aho-corasick", "regex"])
+def extractor(request, monkeypatch):
+    if request.param and not skill_extractor.AHOCORASICK_AVAILABLE:
+        pytest.skip("pyahocorasick not installed")
+    monkeypatch.setattr(skill_extractor, "AHOCORASICK_AVAILABLE", request.param)
+    return SkillExtractorService()
+
+
+@pytest.mark.parametrize("text", [
+    "ranked documents with tf-idf weighting",
+    "exported the report as report.tf",
+    "tf and idf scores",
+])
+def test_short_alias_does_not_create_skill(extractor, text):
+    assert "tensorflow" not in extractor._extract_by_keywords(text)
+
+
+def test_specific_aliases_resolve_to_canonical_skill(extractor):
+    found = extractor._extract_by_keywords("backend on postgres and mongo, deployed with k8s")
+    
+    assert {"postgresql", "mongodb", "kubernetes"} <= found
+    assert not {"postgres", "mongo", "k8s"} & found
+
+
+def test_short_alias_still_categorizes_given_skill_names():
+    assert SkillExtractorService().get_skill_category("TF") == "technical"
+
+
+def test_skill_inside_other_words_is_not_matched(extractor):
+    found = extractor._extract_by_keywords("gopher, jaguar and a javanese tour")
+    
+    assert not {"go", "java", "r"} & found
+
+
+def test_spacy_finds_multi_word_skill_split_across_lines(extractor):
+    nlp = skill_extractor._get_nlp()
+    if nlp is None:
+        pytest.skip("spaCy not installed")
+    text = "Focus: Machine\nLearning and Spring  Boot with Python"
+    
+    keyword_skills = extractor._extract_by_keywords(text.lower())
+    nlp_skills = extractor._extract_by_nlp(nlp, [text])[0]
+    
+    assert not {"machine learning", "spring boot"} & keyword_skills
+    assert nlp_skills == {"machine learning", "spring boot"}
+    assert {"machine learning", "spring boot", "python"} <= set(extractor._extract_batch_sync([text])[0])
+
+
+def test_single_spaced_text_skips_spacy(extractor, monkeypatch):
+    def fail(*args):
+        raise AssertionError("spaCy pass ran on single-spaced text")
+    monkeypatch.setattr(SkillExtractorService, "_extract_by_nlp", fail)
+    
+    found = extractor._extract_batch_sync(["machine learning with python"])[0]
+    
+    assert {"machine learning", "python"} <= set(found)
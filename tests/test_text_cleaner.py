@@ -0,0 +1,31 @@
+"""
+TextCleaner tokenization with and without punctuation removal.
+"""
+
+import pytest
+
+text_cleaner = pytest.importorskip("ml.preprocessing.text_cleaner")
+
+
+@pytest.fixture
+def cleaner(monkeypatch):
+    # Built-in stop words and plain tokenizers, independent of NLTK data
+    monkeypatch.setattr(text_cleaner, "NLTK_AVAILABLE", False)
+    return text_cleaner.TextCleaner()
+
+
+def test_keeps_punctuation_tokens_when_not_removing_punctuation(cleaner):
+    cleaned = cleaner.clean_text(
+        "I know C++, node.js & SQL!",
+        remove_punctuation=False,
+        remove_stopwords=False,
+        lemmatize=False
+    )
+
+    assert cleaned == "i know c++, node.js & sql!"
+
+
+def test_regex_tokens_after_removing_punctuation(cleaner):
+    cleaned = cleaner.clean_text("I know C++, C#, scikit-learn & SQL!")
+
+    assert cleaned == "know c++ c# scikit-learn sql"